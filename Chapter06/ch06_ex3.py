@@ -16,6 +16,26 @@ def pick_lat_lon(lon: Any, lat: Any, alt: Any) -> Tuple[Any, Any]:
 def comma_split(text: str) -> List[str]:
     return text.split(",")
 
+def parse_kml_coord(text: str) -> Tuple[float, float]:
+    """
+    Fused ``comma_split``, ``pick_lat_lon`` and ``map(float, ...)``:
+    one split and one result tuple per point.
+
+    >>> parse_kml_coord("-76.33029518659048,37.54901619777347,0")
+    (37.54901619777347, -76.33029518659048)
+    """
+    lon, lat, _ = text.split(",")
+    return float(lat), float(lon)
+
+# Built once: ElementTree caches the compiled path keyed on
+# the path text and namespace map, so every call reuses it.
+KML_NS_MAP = {
+    "ns0": "http://www.opengis.net/kml/2.2",
+    "ns1": "http://www.google.com/kml/ext/2.2"}
+KML_COORDINATES = (
+    "./ns0:Document/ns0:Folder/"
+    "ns0:Placemark/ns0:Point/ns0:coordinates")
+
 from typing import TextIO, Iterator, Tuple, cast
 def float_lat_lon3(file_obj: TextIO) -> Iterator[Tuple[float, ...]]:
     """
@@ -42,22 +62,10 @@ def float_lat_lon3(file_obj: TextIO) -> Iterator[Tuple[float, ...]]:
     >>> list(float_lat_lon3( doc ))
     [(37.54901619777347, -76.33029518659048)]
     """
-    ns_map = {
-        "ns0": "http://www.opengis.net/kml/2.2",
-        "ns1": "http://www.google.com/kml/ext/2.2"}
-    xpath = (
-        "./ns0:Document/ns0:Folder/"
-        "ns0:Placemark/ns0:Point/ns0:coordinates")
     doc = XML.parse(file_obj)
     return (
-        tuple(
-            map(float,
-                pick_lat_lon(*comma_split(
-                    cast(str, coordinates.text)
-                ))
-               )
-        )
-        for coordinates in doc.findall(xpath, ns_map)
+        parse_kml_coord(cast(str, coordinates.text))
+        for coordinates in doc.findall(KML_COORDINATES, KML_NS_MAP)
     )
 
 test_float_lan_lon3 = """
@@ -80,18 +88,12 @@ def row_iter_kml(file_obj: TextIO) -> Iterator[List[str]]:
     High-level produces application objects.
 
     """
-    ns_map = {
-        "ns0": "http://www.opengis.net/kml/2.2",
-        "ns1": "http://www.google.com/kml/ext/2.2"}
-    xpath = (
-        "./ns0:Document/ns0:Folder/"
-        "ns0:Placemark/ns0:Point/ns0:coordinates")
     doc = XML.parse(file_obj)
     return (
         comma_split(
             cast(str, coordinates.text)
         )
-        for coordinates in doc.findall(xpath, ns_map)
+        for coordinates in doc.findall(KML_COORDINATES, KML_NS_MAP)
     )
 
 def float_lat_lon(
@@ -154,7 +156,9 @@ def color_palette(
     ) -> Tuple[str, str, Tuple[Color, ...]]:
     name, columns = headers
     colors = tuple(
-        Color(int(r), int(g), int(b), " ".join(name))
+        Color(
+            int(r), int(g), int(b),
+            name[0] if len(name) == 1 else " ".join(name))
         for r, g, b, *name in row_iter)
     return name, columns, colors
 
@@ -167,6 +171,8 @@ test_row_iter_gpl = """
 '16'
 >>> len(colors)
 133
+>>> colors[0].name, colors[1].name
+('Almond', 'Antique Brass')
 """
 
 __test__ = {
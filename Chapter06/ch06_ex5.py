@@ -4,7 +4,7 @@
 Chapter 6, Example Set 5
 """
 #pylint: disable=reimported,wrong-import-position
-from typing import Dict, Any, Iterable, Tuple, List, TypeVar
+from typing import Dict, Any, Iterable, Tuple, List, TypeVar, NamedTuple
 
 Leg = Tuple[Any, Any, float]
 T_ = TypeVar("T_")
@@ -65,6 +65,30 @@ def group_sort2(trip: Iterable[Leg]) -> Dict[int, int]:
     # return sorted(tuple(group(quantized)),
     #    key=lambda x:x[1], reverse=True )
 
+class Trip(NamedTuple):
+    """Column-wise ("struct of arrays") view of a trip."""
+    starts: Tuple[Any, ...]
+    ends: Tuple[Any, ...]
+    dists: Tuple[float, ...]
+
+def trip_columns(trip: Iterable[Leg]) -> Trip:
+    """Transpose the legs once so summaries can scan one column
+    instead of unpacking every leg on every pass.
+
+    >>> trip = [ ('s1', 'e1', 1), ('s4', 'e4', 4.9), ('s5', 'e5', 5)]
+    >>> columns = trip_columns(trip)
+    >>> columns.starts
+    ('s1', 's4', 's5')
+    >>> sum(columns.dists)
+    10.9
+    >>> trip_columns([])
+    Trip(starts=(), ends=(), dists=())
+    """
+    all_legs = tuple(trip)
+    if not all_legs:
+        return Trip((), (), ())
+    return Trip(*zip(*all_legs))
+
 from collections import Counter
 def group_Counter(trip: Iterable[Leg]) -> List[Tuple[int, int]]:
     """Group legs into bins with distances 5 nm or less.
@@ -106,6 +130,12 @@ total 2481.3662
 >>> print( "average", round(average,3) )
 average 33.991
 
+>>> columns = trip_columns(trip)
+>>> limits(lat for lat, lon in columns.starts) == (north, south)
+True
+>>> sum(columns.dists) == total
+True
+
 >>> expected = {0.0: 4, 65.0: 1, 35.0: 5, 5.0: 5, 70.0: 2, 40.0: 3, 10.0: 5, 45.0: 3, 15.0: 9, 80.0: 1, 50.0: 3, 115.0: 1, 20.0: 5, 85.0: 1, 55.0: 1, 25.0: 5, 60.0: 3, 125.0: 1, 30.0: 15}
 >>> group_sort1(trip) == expected
 True
@@ -169,6 +199,19 @@ def sum_f(function: Callable[[Any], float], data: Iterable) -> float:
     """
     return sum(function(x) for x in data)
 
+import math
+def fsum_f(function: Callable[[Any], float], data: Iterable) -> float:
+    """
+    Float specialization of :func:`sum_f`. ``math.fsum`` tracks
+    partial sums, so the result is exactly rounded.
+
+    >>> sum_f(lambda x: x/10, [1]*10)
+    0.9999999999999999
+    >>> fsum_f(lambda x: x/10, [1]*10)
+    1.0
+    """
+    return math.fsum(function(x) for x in data)
+
 __test__ = {
     'trip1 demo': trip1,
     'trip2 demo': trip2,
@@ -87,8 +87,8 @@ def float_lat_lon(
         row_iter: Iterator[List[str]]
     ) -> Iterator[Point]:
     return (
-        Point(*map(float, pick_lat_lon(*row)))
-        for row in row_iter
+        Point(float(lat), float(lon))
+        for lon, lat, _ in row_iter
     )
 
 import codecs
@@ -111,6 +111,21 @@ def get_trip(url: str = source) -> List[Leg]:
         trip = list(trip_iter)
     return trip
 
+def get_trips(*urls: str, pool_size: int = 4) -> List[List[Leg]]:
+    """Batch ingestion of several KML sources.
+
+    The reads are blocking I/O, which releases the GIL, so a pool
+    of threads overlaps fetching one file with parsing another.
+    Results are in the same order as the ``urls``.
+
+    >>> trips = get_trips(source, source, pool_size=2)
+    >>> [len(t) for t in trips]
+    [73, 73]
+    """
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=pool_size) as workers:
+        return list(workers.map(get_trip, urls))
+
 find_given_leg_demo = """
 >>> trip= get_trip()
 >>> leg= next(filter(lambda leg: int(leg.distance)==115, trip))
@@ -16,10 +16,11 @@ RawPairIter = Iterable[Tuple[float, float]]
 pairs: Callable[[RawPairIter], List[Pair]] \
      = lambda source: list(Pair(*row) for row in source)
 
+from operator import attrgetter
 from typing import Iterable, Iterator, Tuple
 RankedPair = Tuple[int, Pair]
 def rank_y(pair_iter: Iterable[Pair]) -> Iterator[RankedPair]:
-    return enumerate(sorted(pair_iter, key=lambda p: p.y))
+    return enumerate(sorted(pair_iter, key=attrgetter('y')))
 
 Rank2Pair = Tuple[int, RankedPair]
 def rank_x(ranked_pair_iter: Iterable[RankedPair]) -> Iterator[Rank2Pair]:
@@ -39,11 +39,45 @@ def series(
     ) -> Iterator[Pair]:
     return (Pair(*row[2*n:2*n+2]) for row in row_iter)
 
+from array import array
+from typing import Tuple
+def float_columns(
+        rows: Iterable[Sequence[str]]
+    ) -> Tuple[array, ...]:
+    """Parse rows of text into one ``array('d')`` per column.
+    The floats are stored unboxed and contiguous, rather than as
+    a tuple of tuples of float objects.
+
+    >>> float_columns([['1', '2'], ['3', '4.5']])
+    (array('d', [1.0, 3.0]), array('d', [2.0, 4.5]))
+    """
+    return tuple(array('d', map(float, column)) for column in zip(*rows))
+
+import csv
+from typing import TextIO
+def load_series(n: int, source: TextIO) -> Tuple[Pair, ...]:
+    """Parse only the two columns of series ``n``.
+    The other columns are never converted to float, and no
+    intermediate tuple of rows is built.
+
+    >>> with open("Anscombe.txt") as source:
+    ...     s_IV = load_series(3, source)
+    >>> s_IV[:2]
+    (Pair(x=8.0, y=6.58), Pair(x=8.0, y=5.76))
+    >>> len(s_IV)
+    11
+    """
+    x, y = 2*n, 2*n+1
+    rows = head_reader(csv.reader(source, delimiter='\t'))
+    return tuple(Pair(float(row[x]), float(row[y])) for row in rows)
+
 # Rank Correlation
 
-from collections import defaultdict
+from itertools import compress, groupby
+from operator import attrgetter, itemgetter, sub, ne
 
-from typing import Callable, Tuple, List, TypeVar, cast, Dict
+from functools import lru_cache
+from typing import Callable, Tuple, List, TypeVar, cast
 D_ = TypeVar("D_")
 K_ = TypeVar("K_")
 def rank(
@@ -51,9 +85,8 @@ def rank(
         key: Callable[[D_], K_] = lambda obj: cast(K_, obj)
     ) -> Iterator[Tuple[float, D_]]:
     """Yield the data rank ordered by the given key.
-    Creates a defaultdict(list) in order to discover duplicates.
-    This is a similar to a Counter, but it keeps details and
-    it uses a key function.
+    Sorts the data once, decorated with its key, and uses
+    ``groupby()`` on the runs of equal keys to discover duplicates.
 
     >>> list(rank( [0.8, 1.2, 1.2, 2.3, 18] ) )
     [(1.0, 0.8), (2.5, 1.2), (2.5, 1.2), (4.0, 2.3), (5.0, 18)]
@@ -63,40 +96,21 @@ def rank(
     """
 
     def rank_output(
-            duplicates: Dict[K_, List[D_]],
-            key_iter: Iterator[K_],
-            base: int = 0
+            keyed: List[Tuple[K_, D_]]
         ) -> Iterator[Tuple[float, D_]]:
-        for k in key_iter:
-            dups = len(duplicates[k])
-            for value in duplicates[k]:
+        base = 0
+        for _, group in groupby(keyed, key=itemgetter(0)):
+            same_rank = list(group)
+            dups = len(same_rank)
+            for _, value in same_rank:
                 yield (base+1+base+dups)/2, value
             base += dups
 
-    # Alternative: Properly recursive version of the rank_output loop
-    # pylint: disable=pointless-string-statement
-    """
-    def rank_output(duplicates, key_iter, base=0):
-        k = next(key_iter)
-        dups = len(duplicates[k])
-        for value in duplicates[k]:
-            yield (base+1+base+dups)/2, value
-        yield from rank_output(duplicates, key_iter, base+dups)
-    """
-
-    def build_duplicates(
-            duplicates: Dict[K_, List[D_]],
-            data_iter: Iterator[D_],
-            key: Callable[[D_], K_]
-        ) -> Dict[K_, List[D_]]:
-        for item in data_iter:
-            duplicates[key(item)].append(item)
-        return duplicates
-
-    # Need a properly recursive way to build the dict(list) structure.
-    duplicates = build_duplicates(defaultdict(list), iter(data), key)
-    return rank_output(duplicates, iter(sorted(duplicates)), 0)
+    keyed = sorted(
+        ((key(item), item) for item in data), key=itemgetter(0))
+    return rank_output(keyed)
 
+from itertools import islice
 from typing import Sequence
 def rank2_imp(
         data: Sequence[D_],
@@ -110,12 +124,19 @@ def rank2_imp(
     >>> data= ((2, 0.8), (3, 1.2), (5, 1.2), (7, 2.3), (11, 18))
     >>> list(rank2_imp( data, key=lambda x:x[1] ))
     [(1.0, (2, 0.8)), (2.5, (3, 1.2)), (2.5, (5, 1.2)), (4.0, (7, 2.3)), (5.0, (11, 18))]
+    >>> list(rank2_imp( [] ))
+    []
     """
-    data_iter = iter(sorted(data, key=key))
-    base = 0
-    same_rank = [next(data_iter)]  # Queue().append(data_iter)
-    for value in data_iter:
-        if key(value) == key(same_rank[0]):
+    sorted_data = sorted(data, key=key)
+    if not sorted_data:
+        return
+    base: int = 0
+    dups: int
+    same_rank: List[D_] = [sorted_data[0]]  # Queue().append(data_iter)
+    same_key: K_ = key(same_rank[0])
+    for value in islice(sorted_data, 1, None):
+        value_key = key(value)
+        if value_key == same_key:
             same_rank.append(value)  # or same_rank += [value]
         else:
             dups = len(same_rank)
@@ -123,6 +144,7 @@ def rank2_imp(
                 yield (base+1+base+dups)/2, dup_rank_item
             base += dups
             same_rank = [value]  # same_rank.append()
+            same_key = value_key
     dups = len(same_rank)
     for value in same_rank:  # same_rank.pop()
         yield (base+1+base+dups)/2, value
@@ -133,44 +155,44 @@ def rank2_rec(
     ) -> Iterator[Tuple[float, D_]]:
     """
     Alternative rank without a Counter object.
-    Closer to properly recursive version.
+    The tail-recursive ``ranker`` is unrolled into a loop over
+    the sorted values; the state is the ``base`` rank and the
+    current batch of equal values.
 
     >>> list(rank2_rec( [0.8, 1.2, 1.2, 2.3, 18] ) )
     [(1.0, 0.8), (2.5, 1.2), (2.5, 1.2), (4.0, 2.3), (5.0, 18)]
     >>> data= ((2, 0.8), (3, 1.2), (5, 1.2), (7, 2.3), (11, 18))
     >>> list(rank2_rec( data, key=lambda x:x[1] ))
     [(1.0, (2, 0.8)), (2.5, (3, 1.2)), (2.5, (5, 1.2)), (4.0, (7, 2.3)), (5.0, (11, 18))]
+    >>> list(rank2_rec( [] ))
+    []
     """
-    def yield_sequence(
-            rank: float,
-            same_rank_iter: Iterator[D_]
-        ) -> Iterator[Tuple[float, D_]]:
-        head = next(same_rank_iter)
-        yield rank, head
-        yield from yield_sequence(rank, same_rank_iter)
-
     def ranker(
             sorted_iter: Iterator[D_],
             base: int,
             same_rank_list: List[D_]
         ) -> Iterator[Tuple[float, D_]]:
-        try:
-            value = next(sorted_iter)
-        except StopIteration:
-            dups = len(same_rank_list)
-            yield from yield_sequence((base+1+base+dups)/2, iter(same_rank_list))
-            return
-        if key(value) == key(same_rank_list[0]):
-            yield from ranker(sorted_iter, base, same_rank_list+[value])
-        else:
-            dups = len(same_rank_list)
-            yield from yield_sequence((base+1+base+dups)/2, iter(same_rank_list))
-            for rows in ranker(sorted_iter, base+dups, [value]):
-                yield rows
-
-    data_iter = iter(sorted(data, key=key))
-    head = next(data_iter)
-    yield from ranker(data_iter, 0, [head])
+        dups: int
+        same_rank_list = list(same_rank_list)
+        same_key: K_ = key(same_rank_list[0])
+        for value in sorted_iter:
+            value_key = key(value)
+            if value_key == same_key:
+                same_rank_list.append(value)
+            else:
+                dups = len(same_rank_list)
+                for item in same_rank_list:
+                    yield (base+1+base+dups)/2, item
+                base, same_rank_list = base+dups, [value]
+                same_key = value_key
+        dups = len(same_rank_list)
+        for item in same_rank_list:
+            yield (base+1+base+dups)/2, item
+
+    sorted_data = sorted(data, key=key)
+    if not sorted_data:
+        return
+    yield from ranker(islice(sorted_data, 1, None), 0, [sorted_data[0]])
 
 # Ranked_Y = namedtuple("Ranked_Y", ("r_y", "raw",))
 
@@ -202,7 +224,7 @@ def rank_y(pairs: Iterable[Pair]) -> Iterable[Ranked_Y]:
     """
     return (
         Ranked_Y(rank, data)
-        for rank, data in rank(pairs, lambda pair: pair.y)
+        for rank, data in rank(pairs, attrgetter('y'))
     )
 
 # Ranked_XY = namedtuple("Ranked_XY", ("r_x", "r_y", "raw",))
@@ -216,6 +238,7 @@ def rank_xy(pairs: Sequence[Pair]) -> Iterator[Ranked_XY]:
     Two-pass rank ordering by the x and y members of each pair.
     An intermediate sequence of Rank_Y objects are created with partial
     rankings. The result are Rank_XY objects.
+    See :func:`rank_xy_direct` for a version without the intermediate.
 
     >>> data = (Pair(x=10.0, y=8.04), Pair(x=8.0, y=6.95),
     ... Pair(x=13.0, y=7.58), Pair(x=9.0, y=8.81), Pair(x=11.0, y=8.33),
@@ -236,11 +259,89 @@ def rank_xy(pairs: Sequence[Pair]) -> Iterator[Ranked_XY]:
     """
     return (
         Ranked_XY(r_x=r_x, r_y=rank_y_raw[0], raw=rank_y_raw[1])
-        for r_x, rank_y_raw in rank(rank_y(pairs), lambda r: r.raw.x)
+        for r_x, rank_y_raw in rank(rank_y(pairs), attrgetter('raw.x'))
     )
 
+class XY_Columns(NamedTuple):
+    """Parallel x and y columns of a sequence of Pairs."""
+    x: Tuple[float, ...]
+    y: Tuple[float, ...]
+
+def xy_columns(pairs: Iterable[Pair]) -> XY_Columns:
+    """
+    Transpose Pairs into columns: each ranking pass
+    scans a single column of floats.
+
+    >>> xy_columns([Pair(x=1.0, y=2.0), Pair(x=3.0, y=4.0)])
+    XY_Columns(x=(1.0, 3.0), y=(2.0, 4.0))
+    >>> xy_columns([])
+    XY_Columns(x=(), y=())
+    """
+    columns = tuple(zip(*pairs))
+    if not columns:
+        return XY_Columns((), ())
+    return XY_Columns(*columns)
+
+def average_ranks(values: Sequence[K_]) -> List[float]:
+    """
+    Rank of each value, in the original positions. Tied values
+    share the average of their ranks. One sort of the positions
+    ("argsort"), then the edges of the runs of equal values are
+    found without a data-dependent branch in Python code.
+
+    >>> average_ranks([1.2, 0.8, 18, 1.2, 2.3])
+    [2.5, 1.0, 5.0, 2.5, 4.0]
+    >>> average_ranks([])
+    []
+    """
+    n = len(values)
+    order = sorted(range(n), key=values.__getitem__)
+    ordered = [values[i] for i in order]
+    # Boundary "bitmap" of the sorted values, computed in C;
+    # the run edges are the positions where the bit is set.
+    boundaries = map(ne, ordered[1:], ordered)
+    edges = [0] + list(compress(range(1, n), boundaries)) + [n]
+    ranks = [0.0] * n
+    for start, end in zip(edges, edges[1:]):
+        average = (start+1+end)/2
+        for position in order[start:end]:
+            ranks[position] = average
+    return ranks
+
+def rank_xy_direct(pairs: Sequence[Pair]) -> List[Ranked_XY]:
+    """
+    Same result as :func:`rank_xy`, without the intermediate sequence
+    of Ranked_Y objects or rank()'s decorated copies of the data.
+    The y ranks come from :func:`average_ranks` by position. The
+    positions are then sorted once by Pair -- x, ties broken by y, as
+    the two stable passes of rank_xy would order them -- and the x
+    ranks come from the runs of equal x in that order.
+
+    >>> data = (Pair(x=8.0, y=6.58), Pair(x=8.0, y=5.76),
+    ... Pair(x=19.0, y=12.5), Pair(x=8.0, y=7.71), Pair(x=8.0, y=5.76))
+    >>> rank_xy_direct(data) == list(rank_xy(data))
+    True
+    >>> rank_xy_direct(data)[0]
+    Ranked_XY(r_x=2.5, r_y=1.5, raw=Pair(x=8.0, y=5.76))
+    """
+    r_y = average_ranks([p.y for p in pairs])
+    order = sorted(range(len(pairs)), key=pairs.__getitem__)
+    ranked: List[Ranked_XY] = []
+    base = 0
+    for _, group in groupby(order, key=lambda i: pairs[i].x):
+        same_rank = list(group)
+        dups = len(same_rank)
+        r_x = (base+1+base+dups)/2
+        ranked.extend(Ranked_XY(r_x, r_y[i], pairs[i]) for i in same_rank)
+        base += dups
+    return ranked
+
 def rank_corr(pairs: Sequence[Pair]) -> float:
     """Spearman rank correlation.
+
+    The x and y columns are ranked independently; no intermediate
+    ``Ranked_Y`` or ``Ranked_XY`` objects are built. See :func:`rank_xy`
+    for the two-pass version.
     >>> data = [Pair(x=86.0, y=0.0), Pair(x=97.0, y=20.0),
     ... Pair(x=99.0, y=28.0), Pair(x=100.0, y=27.0), Pair(x=101.0, y=50.0),
     ... Pair(x=103.0, y=29.0), Pair(x=106.0, y=7.0), Pair(x=110.0, y=17.0),
@@ -265,12 +366,71 @@ def rank_corr(pairs: Sequence[Pair]) -> float:
     ... Pair(x=1.8, y=72.19), Pair(x=1.83, y=74.46))
     >>> round(rank_corr( hgt_mass ), 3)
     1.0
+
+    Results are memoized, keyed on the tuple of (immutable) Pairs,
+    so re-computing a correlation for the same data skips the sorts.
+
+    >>> _rank_corr.cache_clear()
+    >>> rank_corr(hgt_mass) == rank_corr(list(hgt_mass))
+    True
+    >>> _rank_corr.cache_info().hits
+    1
+    """
+    return _rank_corr(tuple(pairs))
+
+@lru_cache(maxsize=128)
+def _rank_corr(pairs: Tuple[Pair, ...]) -> float:
+    return spearman(*xy_columns(pairs))
+
+def spearman(x: Sequence[float], y: Sequence[float]) -> float:
+    """Spearman rank correlation of two parallel columns.
+    This is the numeric kernel, free of Pair and NamedTuple
+    handling, used by :func:`rank_corr`.
+
+    >>> spearman([1.0, 2.0, 3.0], [1.0, 3.0, 2.0])
+    0.5
     """
-    ranked = rank_xy(pairs)
-    sum_d_2 = sum((r.r_x - r.r_y)**2 for r in ranked)
-    n = len(pairs)
+    r_x = average_ranks(x)
+    r_y = average_ranks(y)
+    sum_d_2 = sum(d*d for d in map(sub, r_x, r_y))
+    n = len(x)
     return 1-6*sum_d_2/(n*(n**2-1))
 
+def spearman_matrix(
+        columns: Sequence[Sequence[float]]
+    ) -> List[List[float]]:
+    """Spearman rank correlation of every pair of columns.
+    Each column is ranked once, not once per pair it appears in.
+
+    >>> spearman_matrix([[1.0, 2.0, 3.0], [1.0, 3.0, 2.0], [3.0, 2.0, 1.0]])
+    [[1.0, 0.5, -1.0], [0.5, 1.0, -0.5], [-1.0, -0.5, 1.0]]
+    """
+    ranks = [average_ranks(column) for column in columns]
+    k = len(ranks)
+    matrix = [[1.0]*k for _ in range(k)]
+    for i in range(k):
+        n = len(ranks[i])
+        for j in range(i+1, k):
+            sum_d_2 = sum(d*d for d in map(sub, ranks[i], ranks[j]))
+            matrix[i][j] = matrix[j][i] = 1-6*sum_d_2/(n*(n**2-1))
+    return matrix
+
+def spearman_all(
+        series_list: Iterable[Sequence[Pair]],
+        pool_size: int = 4
+    ) -> List[float]:
+    """Spearman rank correlation of several independent series,
+    fanned out to a pool of processes, one series per task.
+
+    >>> s_1 = (Pair(1.0, 1.0), Pair(2.0, 3.0), Pair(3.0, 2.0))
+    >>> s_2 = (Pair(1.0, 3.0), Pair(2.0, 2.0), Pair(3.0, 1.0))
+    >>> spearman_all([s_1, s_2], pool_size=2)
+    [0.5, -1.0]
+    """
+    import concurrent.futures
+    with concurrent.futures.ProcessPoolExecutor(max_workers=pool_size) as workers:
+        return list(workers.map(rank_corr, series_list))
+
 def pearson_corr(pairs: Sequence[Pair]) -> float:
     """Pearson correlation of Pairs.
 
@@ -292,8 +452,11 @@ def pearson_corr(pairs: Sequence[Pair]) -> float:
     >>> round(pearson_corr( hgt_mass ), 5)
     0.99458
     """
-    X = tuple(p.x for p in pairs)
-    Y = tuple(p.y for p in pairs)
+    return _pearson_corr(tuple(pairs))
+
+@lru_cache(maxsize=128)
+def _pearson_corr(pairs: Tuple[Pair, ...]) -> float:
+    X, Y = xy_columns(pairs)
     return Chapter04.ch04_ex4.corr(X, Y)
 
 test_all = """
@@ -334,6 +497,13 @@ Set  III, 0.991, 0.816
 >>> print( "Set {0:>4s}, {1:.3f}, {2:.3f}".format(
 ...     "IV", rank_corr( s_IV ), pearson_corr( s_IV ) ) )
 Set   IV, 0.625, 0.817
+>>> with StringIO(Anscombe) as source:
+...     load_series(3, source) == s_IV
+True
+>>> with StringIO(Anscombe) as source:
+...     columns = float_columns(head_reader(csv.reader(source, delimiter='\\t')))
+>>> spearman(columns[6], columns[7]) == rank_corr(s_IV)
+True
 """
 
 __test__ = {
@@ -67,85 +67,82 @@ def rank_data(
         # Not a sequence? Materialize a sequence object.
         yield from rank_data(list(seq_or_iter), key)
         return
-    data: Sequence[Rank_Data]
     if isinstance(seq_or_iter[0], Rank_Data):
         # Collection of Rank_Data is what we prefer.
-        data = seq_or_iter
+        data = cast(Sequence[Rank_Data], seq_or_iter)
+        for r, rd in rerank(data, key):
+            new_ranks = cast(Tuple[float], rd.rank_seq + cast(Tuple[float], (r,)))
+            yield Rank_Data(new_ranks, rd.raw)
     else:
-        # Collection of non-Rank_Data? Convert to Rank_Data and process.
-        empty_ranks: Tuple[float] = cast(Tuple[float], ())
-        data = list(
-            Rank_Data(empty_ranks, raw_data)
-            for raw_data in cast(Sequence[Source], seq_or_iter)
-        )
-
-    for r, rd in rerank(data, key):
-        new_ranks = cast(Tuple[float], rd.rank_seq + cast(Tuple[float], (r,)))
-        yield Rank_Data(new_ranks, rd.raw)
+        # Collection of non-Rank_Data? Rank the raw values directly,
+        # without wrapping each one in an empty Rank_Data first.
+        sorted_raw = sorted(seq_or_iter, key=key)
+        for r, raw_data in ranker(
+                islice(sorted_raw, 1, None), 0, [sorted_raw[0]], key):
+            yield Rank_Data(cast(Tuple[float], (r,)), raw_data)
 
+from itertools import islice
 from typing import Callable, Tuple, Iterator, Iterable, TypeVar, cast
 def rerank(
         rank_data_iter: Iterable[Rank_Data],
         key: Callable[[Rank_Data], K_]
     ) -> Iterator[Tuple[float, Rank_Data]]:
     """Re-rank by adding another rank order to a Rank_Data object.
+
+    >>> list(rerank([], key=lambda x: x))
+    []
     """
-    sorted_iter = iter(
-        sorted(
-            rank_data_iter, key=lambda obj: key(obj.raw)
-        )
-    )
+    raw_key = lambda obj: key(obj.raw)
+    sorted_list = sorted(rank_data_iter, key=raw_key)
+    if not sorted_list:
+        return
     # Apply ranker to `head, *tail = sorted(rank_data_iter)`
-    head = next(sorted_iter)
-    yield from ranker(sorted_iter, 0, [head], key)
-
-from typing import Iterator, Tuple
-def yield_sequence(
-        rank: float,
-        same_rank_iter: Iterator[Rank_Data]
-    ) -> Iterator[Tuple[float, Rank_Data]]:
-    """Emit a sequence of same rank values."""
-    head = next(same_rank_iter)
-    yield rank, head
-    yield from yield_sequence(rank, same_rank_iter)
+    yield from ranker(
+        islice(sorted_list, 1, None), 0, [sorted_list[0]], raw_key)
 
 from typing import List
 def ranker(
-        sorted_iter: Iterator[Rank_Data],
-        base: float,
-        same_rank_seq: List[Rank_Data],
-        key: Callable[[Rank_Data], K_]
-    ) -> Iterator[Tuple[float, Rank_Data]]:
+        sorted_iter: Iterator[Source],
+        base: int,
+        same_rank_seq: List[Source],
+        key: Callable[[Source], K_]
+    ) -> Iterator[Tuple[float, Source]]:
     """Rank values from a sorted_iter using a base rank value.
+    The key is applied to the values themselves, which may be raw data
+    or Rank_Data objects.
     If the next value's key matches same_rank_seq, accumulate those.
     If the next value's key is different, accumulate same rank values
     and start accumulating a new sequence.
 
+    This is the tail-recursive definition unrolled into a loop:
+    each recursive call becomes one iteration with new values
+    for ``base`` and ``same_rank_seq``.
+
     >>> scalars= [0.8, 1.2, 1.2, 2.3, 18]
     >>> list(rank_data(scalars))  # doctest: +NORMALIZE_WHITESPACE
     [Rank_Data(rank_seq=(1.0,), raw=0.8), Rank_Data(rank_seq=(2.5,), raw=1.2),
      Rank_Data(rank_seq=(2.5,), raw=1.2), Rank_Data(rank_seq=(4.0,), raw=2.3),
      Rank_Data(rank_seq=(5.0,), raw=18)]
     """
-    try:
-        value = next(sorted_iter)
-    except StopIteration:
-        # Final batch
-        dups = len(same_rank_seq)
-        yield from yield_sequence(
-            (base+1+base+dups)/2, iter(same_rank_seq))
-        return
-    if key(value.raw) == key(same_rank_seq[0].raw):
-        # Matching, accumulate a batch
-        yield from ranker(
-            sorted_iter, base, same_rank_seq+[value], key)
-    else:
-        # Non-matching, emit the previous batch and start a new batch
-        dups = len(same_rank_seq)
-        yield from yield_sequence(
-            (base+1+base+dups)/2, iter(same_rank_seq))
-        yield from ranker(
-            sorted_iter, base+dups, [value], key)
+    dups: int
+    same_rank_seq = list(same_rank_seq)
+    same_key: K_ = key(same_rank_seq[0])
+    for value in sorted_iter:
+        value_key = key(value)
+        if value_key == same_key:
+            # Matching, accumulate a batch
+            same_rank_seq.append(value)
+        else:
+            # Non-matching, emit the previous batch and start a new batch
+            dups = len(same_rank_seq)
+            for item in same_rank_seq:
+                yield (base+1+base+dups)/2, item
+            base, same_rank_seq = base+dups, [value]
+            same_key = value_key
+    # Final batch
+    dups = len(same_rank_seq)
+    for item in same_rank_seq:
+        yield (base+1+base+dups)/2, item
 
 __test__ = {
     'example': '''
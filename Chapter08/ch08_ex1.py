@@ -45,6 +45,41 @@ def ordered_leg_iter(
             round(haversine(start, end), 4)
         )
 
+from math import radians, sin, cos, asin, sqrt
+from typing import Iterable
+from Chapter04.ch04_ex1 import NM
+def ordered_path_legs(
+        path_iter: Iterable[Point],
+        R: float = NM
+    ) -> Iterator[Leg]:
+    """Legs of a path, equivalent to ``ordered_leg_iter(legs(path))``.
+
+    The haversine computation is inlined and batched along the path:
+    each point is converted to radians, and its latitude's cosine
+    computed, once; the values are shared by both legs that touch
+    the point.
+
+    >>> path = [Point(36.12, -86.67), Point(33.94, -118.40)]
+    >>> list(ordered_path_legs(path, R=6372.8))  # doctest: +NORMALIZE_WHITESPACE
+    [Leg(order=0, start=Point(latitude=36.12, longitude=-86.67),
+     end=Point(latitude=33.94, longitude=-118.4), distance=2887.26)]
+    >>> list(ordered_path_legs([]))
+    []
+    """
+    path = iter(path_iter)
+    start = next(path, None)
+    if start is None:
+        return
+    lat_1, lon_1 = radians(start[0]), radians(start[1])
+    cos_1 = cos(lat_1)
+    for order, end in enumerate(path):
+        lat_2, lon_2 = radians(end[0]), radians(end[1])
+        cos_2 = cos(lat_2)
+        a = sqrt(
+            sin((lat_2-lat_1)/2)**2 + cos_1*cos_2*sin((lon_2-lon_1)/2)**2)
+        yield Leg(order, start, end, round(R*2*asin(a), 4))
+        start, lat_1, lon_1, cos_1 = end, lat_2, lon_2, cos_2
+
 test_parser = """
 >>> from Chapter06.ch06_ex3 import row_iter_kml
 >>> from Chapter04.ch04_ex1 import legs, haversine
@@ -64,6 +99,11 @@ Leg(order=0, start=Point(latitude=37.54901619777347, longitude=-76.3302951865904
 >>> trip[-1]
 Leg(order=72, start=Point(latitude=38.330166, longitude=-76.458504), end=Point(latitude=38.976334, longitude=-76.473503), distance=38.8019)
 
+>>> with urllib.request.urlopen(filename) as source:
+...    path_iter = float_lat_lon(row_iter_kml(source))
+...    trip_2 = list(ordered_path_legs(path_iter))
+>>> trip_2 == trip
+True
 """
 
 __test__ = {
@@ -18,20 +18,6 @@ Comparator = Callable[[Tuple[float, float]], bool]
 neq: Comparator = lambda xy: abs(x(xy)-y(xy)) > 1.0E-12
 
 T_ = TypeVar("T_")
-def until(
-        terminate: Callable[[T_], bool],
-        iterator: Iterator[T_]
-    ) -> T_:
-    i = next(iterator)
-    if terminate(i):
-        return i
-    return until(terminate, iterator)
-
-accumulated_error_1 = """
->>> until(neq, source)
-(92.799999999999, 92.80000000000001)
-"""
-
 def until_i(
         terminate: Callable[[T_], bool],
         iterator: Iterator[T_]) -> T_:
@@ -40,6 +26,27 @@ def until_i(
             return i
     raise StopIteration
 
+def until_diff(
+        tolerance: float,
+        iterator: Iterator[Tuple[float, float]]
+    ) -> Tuple[float, float]:
+    """Specialized ``until_i(neq, iterator)``: the pair is unpacked
+    in the loop header and compared directly, with no
+    extractor or comparator function calls per pair.
+
+    >>> until_diff(1.0E-12, zip(count(0, 0.1), (.1*c for c in count())))
+    (92.799999999999, 92.80000000000001)
+    """
+    for a, b in iterator:
+        if abs(a-b) > tolerance:
+            return a, b
+    raise StopIteration
+
+accumulated_error_1 = """
+>>> until_i(neq, source)
+(92.799999999999, 92.80000000000001)
+"""
+
 accumulated_error_2 = """
 >>> source_2 = zip(count(0, .1), (.1*c for c in count()))
 >>> x = lambda x_y: x_y[0]
@@ -53,6 +60,9 @@ accumulated_error_2 = """
 >>> source_4 = zip( count(0, 1/35), (c/35 for c in count()) )
 >>> until_i(lambda xy: x(xy) != y(xy), source_4)
 (0.2285714285714286, 0.22857142857142856)
+>>> source_5 = zip(count(0, .1), (.1*c for c in count()))
+>>> until_diff(1.0E-6, source_5)
+(94281.30000100001, 94281.3)
 """
 
 fizz_buzz = """
@@ -6,26 +6,20 @@ Chapter 8, Example Set 3
 # pylint: disable=reimported,wrong-import-position,wrong-import-order
 
 from itertools import (
-    accumulate, repeat, chain, starmap, tee, dropwhile, islice, groupby
+    chain, starmap, dropwhile, islice, groupby
     )
 
-# Accumulate
-# repeat(8128, times=13) -- only the first value is used
-# other 13 are to create a sequence of values to drive the generator function
-
 from typing import List
 def digits_fixed(value: int, digits: int, base: int) -> List[int]:
     """
     >>> digits_fixed(8128, 16, 2)
     [0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0]
     """
-    digits_reversed = (
-        x % base
-        for x in accumulate(
-            repeat(value, digits), func=lambda x, y: x//base
-        )
-    )
-    return list(reversed(list(digits_reversed)))
+    out = [0]*digits
+    v = value
+    for i in range(digits-1, -1, -1):
+        v, out[i] = divmod(v, base)
+    return out
 
 from typing import Callable, Iterator, TypeVar
 T_ = TypeVar("T_")
@@ -33,42 +27,42 @@ def while_not(
         terminate: Callable[[T_], bool],
         iterator: Iterator[T_]
     ) -> Iterator[T_]:
-    """Iterator which terminates."""
-    i = next(iterator)
-    if terminate(i):
-        return
-    yield i
-    yield from while_not(terminate, iterator)
+    """Iterator which terminates.
+
+    >>> list(while_not(lambda x: x == 0, iter([3, 2, 1, 0, 9])))
+    [3, 2, 1]
+    >>> list(while_not(lambda x: x == 0, iter(range(5000, 0, -1))))[-1]
+    1
+    """
+    for i in iterator:
+        if terminate(i):
+            return
+        yield i
 
 def digits_variable(value: int, base: int) -> List[int]:
     """
     >>> digits_variable(8128, 2)
     [1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0]
+    >>> digits_variable(0, 2)
+    []
     """
-    digits_reversed = (
-        x % base
-        for x in while_not(
-            lambda x: x == 0,
-            accumulate(repeat(value), lambda x, y: x//base)
-        )
-    )
-    return list(reversed(list(digits_reversed)))
+    out: List[int] = []
+    v = value
+    while v:
+        v, r = divmod(v, base)
+        out.append(r)
+    out.reverse()
+    return out
 
 def accumulating_collatz(start: int) -> Iterator[int]:
     """
     >>> list(accumulating_collatz(12))
     [12, 6, 3, 10, 5, 16, 8, 4, 2]
     """
-
-    def syracuse(n: int) -> int:
-        if n % 2 == 0:
-            return n // 2
-        return 3*n+1
-
-    return while_not(
-        lambda x: x == 1,
-        accumulate(repeat(start), lambda a, b: syracuse(a))
-    )
+    n = start
+    while n != 1:
+        yield n
+        n = n // 2 if n % 2 == 0 else 3*n+1
 
 from Chapter04.ch04_ex1 import legs, haversine
 from Chapter07.ch07_ex1 import Leg
@@ -87,10 +81,14 @@ def quartiles(trip: List[Leg]) -> List[int]:
      3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3]
     """
     #print( trip[:2], trip[-1] )
-    distances = (leg.distance for leg in trip)
-    distance_accum = tuple(accumulate(distances))
-    total = distance_accum[-1]+1.0
-    quartiles = list(int(4*d/total) for d in distance_accum)
+    distances = [leg.distance for leg in trip]
+    total = sum(distances)+1.0
+    inv = 4.0/total
+    quartiles = [0]*len(distances)
+    d_accum = 0.0
+    for i, d in enumerate(distances):
+        d_accum += d
+        quartiles[i] = int(d_accum*inv)
     #print( list(quartiles[a:a+16] for a in range(0,len(quartiles),16)) )
     return quartiles
 
@@ -114,13 +112,14 @@ def row_iter_csv_tab(*filenames: str) -> Iterator[List[str]]:
         ]
         # readers = [csv.reader(f, delimiter='\t') for f in files]
         readers = map(lambda f: csv.reader(f, delimiter='\t'), files)
-        yield from chain(*readers)
+        yield from chain.from_iterable(readers)
 
 grouping_A = """
 >>> from Chapter07.ch07_ex1 import get_trip
 >>> trip= get_trip()
 >>> quartile= quartiles(trip)
->>> group_iter= groupby( zip( quartile, trip ), key= lambda q_raw: q_raw[0] )
+>>> from operator import itemgetter
+>>> group_iter= groupby( zip( quartile, trip ), key= itemgetter(0) )
 >>> for group_key, group_iter in group_iter:
 ...    print( "Group", group_key+1, len(list(group_iter)) )
 Group 1 23
@@ -129,25 +128,24 @@ Group 3 19
 Group 4 17
 """
 
-from collections import defaultdict
 from typing import Iterable, Callable, Tuple, List, Dict
 D_ = TypeVar("D_")
 K_ = TypeVar("K_")
 def groupby_2(
         iterable: Iterable[D_],
         key: Callable[[D_], K_]
-    ) -> Iterator[Tuple[K_, Iterator[D_]]]:
-    groups: Dict[K_, List[D_]] = defaultdict(list)
+    ) -> Iterator[Tuple[K_, List[D_]]]:
+    groups: Dict[K_, List[D_]] = {}
     for item in iterable:
-        groups[key(item)].append(item)
-    for g in groups:
-        yield g, iter(groups[g])
+        groups.setdefault(key(item), []).append(item)
+    yield from groups.items()
 
 grouping_B = """
 >>> from Chapter07.ch07_ex1 import get_trip
 >>> trip= get_trip()
 >>> quartile= quartiles(trip)
->>> group_iter= groupby_2( zip( quartile, trip ), key= lambda q_raw: q_raw[0] )
+>>> from operator import itemgetter
+>>> group_iter= groupby_2( zip( quartile, trip ), key= itemgetter(0) )
 >>> for group_key, group_iter in group_iter:
 ...     print( "Group", group_key+1, len(list(group_iter)) )
 Group 1 23
@@ -259,10 +257,12 @@ def teeing_A():
     """
     import csv
     def mean(iterator: Iterator[float]) -> float:
-        it0, it1 = tee(iterator, 2)
-        N = sum(1 for x in it0)
-        s1 = sum(x for x in it1)
-        return s1/N
+        n = 0
+        s1 = 0.0
+        for x in iterator:
+            n += 1
+            s1 += x
+        return s1/n
     def number(x: Any) -> bool:
         try:
             float(x)
@@ -42,37 +42,55 @@ def get_colors(filename: str = "crayola.gpl") -> Sequence[Color]:
             for color, name in color_rows)
     return colors
 
+from typing import List
+PaletteEntry = Tuple[int, int, int, Color]
+def get_palette(colors: Iterable[Color]) -> List[PaletteEntry]:
+    """Flat ``(r, g, b, color)`` rows for the distance kernels.
+
+    >>> get_palette(get_colors())[0]
+    (239, 222, 205, Color(rgb=(239, 222, 205), name='Almond'))
+    """
+    return [(*color.rgb, color) for color in colors]
+
 from typing import Iterator, Tuple
 Point = Tuple[int, int]
 RGB = Tuple[int, int, int]
 Pixel = Tuple[Point, RGB]
 def pixel_iter(img: Image) -> Iterator[Pixel]:
     w, h = img.size
+    pixels = img.load()  # Direct pixel access, bypasses getpixel()
     return (
-        (c, img.getpixel(c))
+        (c, pixels[c])
         for c in product(range(w), range(h))
     )
 
 import math
 def euclidean(pixel: RGB, color: Color) -> float:
-    return math.sqrt(
-        sum(map(
-            lambda x, y: (x-y)**2,
-            pixel,
-            color.rgb))
-        )
+    """
+    >>> euclidean((92, 139, 195), Color(rgb=(239, 222, 205), name='Almond'))
+    169.10943202553784
+    """
+    r, g, b = pixel
+    c_r, c_g, c_b = color.rgb
+    return math.sqrt((r-c_r)**2 + (g-c_g)**2 + (b-c_b)**2)
 
 def manhattan(pixel: RGB, color: Color) -> float:
-    return sum(map(
-        lambda x, y: abs(x-y),
-        pixel,
-        color.rgb))
+    """
+    >>> manhattan((92, 139, 195), Color(rgb=(239, 222, 205), name='Almond'))
+    240
+    """
+    r, g, b = pixel
+    c_r, c_g, c_b = color.rgb
+    return abs(r-c_r) + abs(g-c_g) + abs(b-c_b)
 
 def max_d(pixel: RGB, color: Color) -> float:
-    return max(map(
-        lambda x, y: abs(x-y),
-        pixel,
-        color.rgb))
+    """
+    >>> max_d((92, 139, 195), Color(rgb=(239, 222, 205), name='Almond'))
+    147
+    """
+    r, g, b = pixel
+    c_r, c_g, c_b = color.rgb
+    return max(abs(r-c_r), abs(g-c_g), abs(b-c_b))
 
 # from itertools import islice
 from typing import TypeVar, Iterable, List
@@ -82,20 +100,17 @@ def take(n: int, iterable: Iterable[T_]) -> List[T_]:
     return list(islice(iterable, n))
 
 from itertools import groupby #, product
+from operator import itemgetter
 def matching_1(
         pixels: Iterable[Pixel],
         colors: Iterable[Color]
     ) -> Iterator[Tuple[Point, RGB, Color, float]]:
 
-    xy = lambda xyp_c: xyp_c[0][0]
-    p = lambda xyp_c: xyp_c[0][1]
-    c = lambda xyp_c: xyp_c[1]
-
     distances = (
-        (xy(item), p(item), c(item), euclidean(p(item), c(item)))
-        for item in product(pixels, colors))
-    for _, choices in groupby(distances, key=lambda xy_p_c_d: xy_p_c_d[0]):
-        yield min(choices, key=lambda xypcd: xypcd[3])
+        (xy, p, c, euclidean(p, c))
+        for (xy, p), c in product(pixels, colors))
+    for _, choices in groupby(distances, key=itemgetter(0)):
+        yield min(choices, key=itemgetter(3))
 
 test_matching_1 = """
 >>> img= Image.open("IMG_2705.jpg")
@@ -122,18 +137,33 @@ Takes a loooong time -- don't actually do this:
 >>> revised= list( matching_1(pixel_iter(img), colors))
 """
 
+from typing import Dict
 def matching_2(
         pixels: Iterable[Pixel],
         colors: Iterable[Color]
     ) -> Iterator[Tuple[Point, RGB, Color, float]]:
 
+    """
+    The inner loop over colors is a plain scalar kernel: squared
+    distance by straight-line integer arithmetic, and only the
+    winning color gets a sqrt and an output tuple.
+    Photographs repeat the same RGB values a lot, so each distinct
+    pixel value is matched once and remembered.
+    """
+    palette = get_palette(colors)
+    cache: Dict[RGB, Tuple[Color, float]] = {}
     for xy, pixel in pixels:
-        choices = map(
-            lambda color: (
-                xy, pixel, color, euclidean(pixel, color)
+        hit = cache.get(pixel)
+        if hit is None:
+            r, g, b = pixel
+            d_2, color = min(
+                (
+                    ((c_r-r)**2 + (c_g-g)**2 + (c_b-b)**2, color)
+                    for c_r, c_g, c_b, color in palette
                 ),
-            colors)
-        yield min(choices, key=lambda xypcd: xypcd[3])
+                key=itemgetter(0))
+            hit = cache[pixel] = color, math.sqrt(d_2)
+        yield (xy, pixel, *hit)
 
 test_matching_2 = """
 >>> img= Image.open("IMG_2705.jpg")
@@ -174,7 +204,9 @@ class Color(NamedTuple):
     name: str
 import math
 def euclidean( pixel, color ):
-   return math.sqrt( sum( map( lambda x,y: (x-y)**2, pixel, color.rgb ) ) )
+    r, g, b = pixel
+    c_r, c_g, c_b = color.rgb
+    return math.sqrt( (r-c_r)**2 + (g-c_g)**2 + (b-c_b)**2 )
         """
     )
     print("Euclidean", perf)
@@ -189,16 +221,19 @@ class Color(NamedTuple):
     rgb: Tuple[int, ...]
     name: str
 def manhattan( pixel, color ):
-    return sum( map( lambda x,y: abs(x-y), pixel, color.rgb ) )
+    r, g, b = pixel
+    c_r, c_g, c_b = color.rgb
+    return abs(r-c_r) + abs(g-c_g) + abs(b-c_b)
         """
     )
     print("Manhattan", perf)
 
     perf = timeit.timeit(
         """
-min(choices, key=lambda xypcd: xypcd[3] )
+min(choices, key=itemgetter(3) )
         """,
         setup="""
+from operator import itemgetter
 from typing import NamedTuple, Tuple
 class Color(NamedTuple):
     rgb: Tuple[int, ...]
@@ -231,13 +266,20 @@ def gather_data():
 
 from typing import Dict
 def make_color_map(colors: Sequence[Color]) -> Dict[RGB, Color]:
+    """Nearest color for each of the 512 3-bit RGB values.
+    Squared distances are computed inline: they have the same
+    minimum as ``euclidean()`` without a sqrt, map, or lambda.
+    """
     bit3 = range(0, 256, 0b100000)
+    palette = get_palette(colors)
 
-    best_iter = (
-        min((euclidean(rgb, c), rgb, c) for c in colors)
-        for rgb in product(bit3, bit3, bit3)
-    )
-    color_map = dict((b[1], b[2]) for b in best_iter)
+    def nearest(rgb: RGB) -> Color:
+        r, g, b = rgb
+        return min(
+            ((c_r-r)**2 + (c_g-g)**2 + (c_b-b)**2, color)
+            for c_r, c_g, c_b, color in palette)[1]
+
+    color_map = {rgb: nearest(rgb) for rgb in product(bit3, bit3, bit3)}
     return color_map
 
 test_make_color_map = """
@@ -250,17 +292,41 @@ Color(rgb=(0, 0, 0), name='Black')
 >>> m[(224,224,224)]
 Color(rgb=(219, 215, 210), name='Timberwolf')
 
+>>> img = Image.open("IMG_2705.jpg").crop((0, 0, 4, 3))
+>>> clone = clone_image(m, img)
+>>> clone.size
+(4, 3)
+>>> all(clone.getpixel(xy) == m[tuple(c & 0b11100000 for c in rgb)].rgb
+...     for xy, rgb in pixel_iter(img))
+True
 """
 
+from typing import Optional
+def clone_image(color_map: Dict[RGB, Color], img: Image) -> Image:
+    """Replace every pixel with its color_map color.
+    The pixels are read with one ``getdata()`` and written with
+    one ``putdata()``, rather than a getpixel/putpixel per pixel.
+    The 512 quantized colors live in a flat list indexed by the high
+    three bits of each channel, so there's no tuple or hash per pixel.
+    A pixel whose color isn't in color_map raises KeyError.
+    """
+    lut: List[Optional[RGB]] = [None]*512
+    for (q_r, q_g, q_b), color in color_map.items():
+        lut[(q_r>>5)<<6 | (q_g>>5)<<3 | q_b>>5] = color.rgb
+    pixels = [
+        lut[(r>>5)<<6 | (g>>5)<<3 | b>>5]
+        for r, g, b in img.getdata()
+    ]
+    if None in lut and None in pixels:
+        r, g, b = img.getdata()[pixels.index(None)]
+        raise KeyError((r & 0b11100000, g & 0b11100000, b & 0b11100000))
+    clone = img.copy()
+    clone.putdata(pixels)
+    return clone
+
 def clone_picture(color_map: Dict[RGB, Color], filename: str = "IMG_2705.jpg"):
-    mask = 0b11100000
     img = Image.open(filename)
-    clone = img.copy()
-    for xy, rgb in pixel_iter(img):
-        r, g, b = rgb
-        repl = color_map[(mask&r, mask&g, mask&b)]
-        clone.putpixel(xy, repl.rgb)
-    clone.show()
+    clone_image(color_map, img).show()
 
 def demo():
     start = time.perf_counter()
@@ -33,20 +33,96 @@ def get_cost_matrix() -> List[Tuple[int, ...]]:
 
 from itertools import *
 
+from operator import getitem
+
+def assignment_permutations(
+        cost: List[Tuple[int, ...]]
+    ) -> List[Tuple[int, ...]]:
+    """Exhaustive search over all n! permutations."""
+    n = len(cost)
+    columns = list(zip(*cost))
+    best = None
+    solutions: List[Tuple[int, ...]] = []
+    for perm in permutations(range(n)):
+        s = sum(map(getitem, columns, perm))
+        if best is None or s < best:
+            best, solutions = s, [perm]
+        elif s == best:
+            solutions.append(perm)
+    return solutions
+
 def assignment(cost: List[Tuple[int, ...]]) -> List[Tuple[int, ...]]:
+    """All optimal permutations, via the Hungarian method.
+
+    The O(n**3) Hungarian method finds dual potentials ``u`` and ``v``
+    where every optimal assignment uses only "tight" cells, those with
+    ``cost[x][y] == u[y] + v[x]``. A backtracking search over the tight
+    cells then yields every optimum, in the same order as the
+    exhaustive search.
+
+    >>> cost = get_cost_matrix()
+    >>> assignment(cost) == assignment_permutations(cost)
+    True
+    """
     n = len(cost)
-    perms = permutations(range(n))
-    alt = [
-        (
-            sum(
-                cost[x][y] for y, x in enumerate(perm)
-            ),
-            perm
-        )
-        for perm in perms
+    a = list(zip(*cost))  # a[y][x]: cost of putting row x in position y
+    u = [0]*(n+1)
+    v = [0]*(n+1)
+    p = [0]*(n+1)
+    way = [0]*(n+1)
+    for i in range(1, n+1):
+        p[0] = i
+        j0 = 0
+        minv = [float('inf')]*(n+1)
+        used = [False]*(n+1)
+        while p[j0] != 0:
+            used[j0] = True
+            i0 = p[j0]
+            a_i0 = a[i0-1]
+            u_i0 = u[i0]
+            delta = float('inf')
+            j1 = 0
+            for j in range(1, n+1):
+                if not used[j]:
+                    cur = a_i0[j-1] - u_i0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(n+1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    tight = [
+        [x for x in range(n) if a[y][x] == u[y+1] + v[x+1]]
+        for y in range(n)
     ]
-    m = min(alt)[0]
-    return [ans for s, ans in alt if s == m]
+    solutions: List[Tuple[int, ...]] = []
+    perm: List[int] = []
+    taken = [False]*n
+    def extend(y: int) -> None:
+        if y == n:
+            solutions.append(tuple(perm))
+            return
+        for x in tight[y]:
+            if not taken[x]:
+                taken[x] = True
+                perm.append(x)
+                extend(y+1)
+                perm.pop()
+                taken[x] = False
+    extend(0)
+    return solutions
 
 test_assignment = """
 >>> from pprint import pprint
@@ -47,16 +47,18 @@ def column_data(*data_sets: List[str]) -> Iterator[List[str]]:
     def year_fixup(row: List[Optional[str]]) -> List[str]:
         return list(c or "year" for c in row)
 
-    row = list(ds[g*12] for ds in data_sets for g in range(3))
-    yield year_fixup(row)
+    cells = [(ds, g*12) for ds in data_sets for g in range(3)]
+    yield year_fixup([ds[base] for ds, base in cells])
 
     # Can be done with filter(None, ...), also.
     for i in range(1, 12):
-        row = list(ds[g*12+i] for ds in data_sets for g in range(3))
+        row = [ds[base+i] for ds, base in cells]
         if any(row):
             yield row
 
+from functools import lru_cache
 from typing import Union
+@lru_cache(maxsize=1024)
 def num_cvt(string: str) -> Union[int, float]:
     """
     >>> num_cvt("2007")
@@ -70,11 +72,9 @@ def num_cvt(string: str) -> Union[int, float]:
         return int(string)
     except ValueError:
         pass
-    try:
-        return float(string)
-    except ValueError:
-        pass
-    return int(string.replace(",", ""))
+    if "," in string:
+        return int(string.replace(",", ""))
+    return float(string)
 
 from typing import Iterable, Iterator
 def convert(
@@ -108,20 +108,30 @@ def column(source: Iterable[List[T_]], x: int) -> Iterator[T_]:
         yield row[x]
 
 from itertools import *
-from Chapter04.ch04_ex4 import corr
+from operator import mul
+from Chapter04.ch04_ex4 import corr, mean, stdev, z
 
 from typing import TypeVar, List, Union, Tuple, Iterator
 def multi_corr(
         source: List[List[Union[str, float]]]
     ) -> Iterator[Tuple[Union[str, float], Union[str, float], float]]:
-    n = len(source[0])
+    """Correlations for all pairs of columns with distinct headers.
+
+    Each column is standardized once; ``r`` for a pair is then the
+    mean of the products of their z-scores, as in :func:`corr`.
+    """
+    columns = list(zip(*source))
+    n = len(columns)
+    headers = [col[0] for col in columns]
+    z_scores = []
+    for _, *data in columns:
+        m_x, s_x = mean(data), stdev(data)
+        z_scores.append([z(x, m_x, s_x) for x in data])
     for p, q in combinations(range(n), 2):
-        header_p, *data_p = list(column(source, p))
-        header_q, *data_q = list(column(source, q))
-        if header_p == header_q:
+        if headers[p] == headers[q]:
             continue
-        r_pq = corr(data_p, data_q)
-        yield header_p, header_q, r_pq
+        r_pq = sum(map(mul, z_scores[p], z_scores[q]))/len(z_scores[p])
+        yield headers[p], headers[q], r_pq
 
 test_multi_corr = """
 >>> source = list(convert(column_data(s7, s3890, s43)))
@@ -142,6 +152,11 @@ test_multi_corr = """
 >>> print( "{2: 4.2f}: {0} vs {1}".format(*results[32]) )
  0.88: US crude oil imports from VenezuelaMillions of barrels (Dept. of Energy) vs Per capita consumption of high fructose corn syrup (US)Pounds (USDA)
 
+>>> columns = list(zip(*source))
+>>> r_01 = corr(columns[0][1:], columns[1][1:])
+>>> abs(results[0][2] - r_01) < 1e-12
+True
+
 """
 
 __test__ = {
@@ -6,20 +6,43 @@ Chapter 10, Example Set 1
 # pylint: disable=wrong-import-position
 
 def fib(n: int) -> int:
-    """Fibonacci numbers with naive recursion
+    """Fibonacci numbers by iteration
+
+    The recursive definition is F(n) = F(n-1) + F(n-2); stepping the
+    pair (F(k), F(k+1)) forward n times computes it in O(n).
 
     >>> fib(20)
     6765
     >>> fib(1)
     1
+    >>> fib(0)
+    0
     """
-    if n == 0: return 0
-    if n == 1: return 1
-    return fib(n-1) + fib(n-2)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a+b
+    return a
+
+def fib_fast(n: int) -> int:
+    """Fibonacci numbers by fast doubling, O(log n) multiplies
+
+    F(2k) = F(k)*(2*F(k+1) - F(k)) and F(2k+1) = F(k)**2 + F(k+1)**2.
+
+    >>> fib_fast(20)
+    6765
+    >>> all(fib_fast(n) == fib(n) for n in range(100))
+    True
+    """
+    a, b = 0, 1  # F(k), F(k+1) for k = the leading bits of n seen so far
+    for bit in bin(n)[2:]:
+        a, b = a*(2*b - a), a*a + b*b
+        if bit == "1":
+            a, b = b, a+b
+    return a
 
 from functools import lru_cache
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=None)
 def fibc(n: int) -> int:
     """Fibonacci numbers with naive recursion and caching
 
@@ -38,13 +61,18 @@ def performance_fib():
     f1 = timeit.timeit(
         """fib(20)""",
         setup="""from ch10_ex1 import fib""", number=1000)
-    print("Naive", f1)
+    print("Iterative", f1)
 
     f2 = timeit.timeit(
         """fibc(20); fibc.cache_clear()""",
         setup="""from ch10_ex1 import fibc""", number=1000)
     print("Cached", f2)
 
+    f3 = timeit.timeit(
+        """fib_fast(20)""",
+        setup="""from ch10_ex1 import fib_fast""", number=1000)
+    print("Fast doubling", f3)
+
 def nfact(n: int) -> int:
     """
     >>> nfact(5)
@@ -53,7 +81,7 @@ def nfact(n: int) -> int:
     if n == 0: return 1
     return n*nfact(n-1)
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=None)
 def cfact(n: int) -> int:
     """
     >>> cfact(5)
@@ -62,16 +90,37 @@ def cfact(n: int) -> int:
     if n == 0: return 1
     return n*cfact(n-1)
 
-from typing import Callable
-def binom(p: int, r: int, fact: Callable[[int], int]) -> int:
+from itertools import accumulate, chain
+from operator import mul
+_FACT = tuple(accumulate(chain((1,), range(1, 101)), mul))  # 0! .. 100!
+
+from typing import Callable, Optional
+def binom(p: int, r: int, fact: Optional[Callable[[int], int]] = None) -> int:
     """
+    Without a ``fact`` function, factorials up to 100! come from a
+    table built at import time.
+
     >>> nfact(5)
     120
     >>> binom(52, 5, nfact)
     2598960
     >>> binom(52, 5, cfact)
     2598960
+    >>> binom(52, 5)
+    2598960
+    >>> binom(120, 2)
+    7140
+    >>> binom(3, 5)
+    Traceback (most recent call last):
+    ...
+    ValueError: binom(3, 5) requires 0 <= r <= p
     """
+    if not 0 <= r <= p:
+        raise ValueError(f"binom({p}, {r}) requires 0 <= r <= p")
+    if fact is None:
+        if p < len(_FACT):
+            return _FACT[p]//(_FACT[r]*_FACT[p-r])
+        fact = cfact
     return fact(p)//(fact(r)*fact(p-r))
 
 def performance_fact():
@@ -92,6 +141,11 @@ def performance_fact():
         setup="""from ch10_ex1 import binom, cfact""", number=10000)
     print("Cached Factorial, Cleared", f3)
 
+    f4 = timeit.timeit(
+        """binom(52, 5)""",
+        setup="""from ch10_ex1 import binom""", number=10000)
+    print("Factorial Table", f4)
+
 def performance():
     performance_fib()
     performance_fact()
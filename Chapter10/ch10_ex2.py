@@ -6,7 +6,7 @@ Chapter 10, Example Set 2
 # pylint: disable=wrong-import-position
 
 from numbers import Number
-from functools import total_ordering
+from operator import itemgetter, eq, ne, lt, le, gt, ge
 from typing import NamedTuple
 
 class Card1(NamedTuple):
@@ -34,10 +34,23 @@ False
 "Card1(rank=2, suit='♠')== Card1(rank=2, suit='♥'): False"
 """
 
-from typing import Union, Any
+from typing import Union, Any, Callable
 CardInt = Union['Card', int]
 
-@total_ordering
+def _card_compare(op: Callable[[int, int], bool], rank: int, other: Any) -> Any:
+    """op applied to a Card's rank and other's rank, or NotImplemented.
+    Exact type checks come first; isinstance() is only for subclasses."""
+    t = type(other)
+    if t is Card:
+        return op(rank, other[0])
+    if t is int:
+        return op(rank, other)
+    if isinstance(other, Card):
+        return op(rank, other[0])
+    if isinstance(other, int):
+        return op(rank, other)
+    return NotImplemented
+
 class Card(tuple):
     """Immutable object; rank-only comparisons.
     
@@ -47,28 +60,24 @@ class Card(tuple):
     """
     __slots__ = ()
     def __new__(cls, rank, suit):
-        obj = super().__new__(Card, (suit, rank))
+        obj = super().__new__(cls, (rank, suit))
         return obj
     def __repr__(self) -> str:
-        return "{0.rank}{0.suit}".format(self)
-    @property
-    def rank(self) -> int:
-        return self[1]
-    @property
-    def suit(self) -> str:
-        return self[0]
+        return f"{self[0]}{self[1]}"
+    rank = property(itemgetter(0), doc="Card rank")
+    suit = property(itemgetter(1), doc="Card suit")
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, Card):
-            return self.rank == other.rank
-        elif isinstance(other, int):
-            return self.rank == other
-        return NotImplemented
+        return _card_compare(eq, self[0], other)
+    def __ne__(self, other: Any) -> bool:
+        return _card_compare(ne, self[0], other)
     def __lt__(self, other: Any) -> bool:
-        if isinstance(other, Card):
-            return self.rank < other.rank
-        elif isinstance(other, int):
-            return self.rank < other
-        return NotImplemented
+        return _card_compare(lt, self[0], other)
+    def __le__(self, other: Any) -> bool:
+        return _card_compare(le, self[0], other)
+    def __gt__(self, other: Any) -> bool:
+        return _card_compare(gt, self[0], other)
+    def __ge__(self, other: Any) -> bool:
+        return _card_compare(ge, self[0], other)
 
 test_eq = """
 >>> c2s= Card(2, '\u2660')
@@ -93,6 +102,8 @@ True
 True
 >>> 2 == c2h
 True
+>>> c2h == True, c2h < Card(3, '\u2665')
+(False, True)
 """
 
 test_order = """
@@ -110,39 +121,49 @@ True
 """
 
 extra_comparisons = """
-These don't work, the logic doesn't fit with total_ordering.
+With all six comparisons written out (rather than derived by
+total_ordering), the int comparisons work in both directions.
 
 >>> c4c= Card(4, '\u2663')
->>> try:
-...     print("c4c > 3", c4c > 3)
-... except TypeError as e:
-...     print(e)
-'>' not supported between instances of 'Card' and 'int'
->>> try:
-...     print("3 < c4c", 3 < c4c)
-... except TypeError as e:
-...     print(e)
-'<' not supported between instances of 'int' and 'Card'
+>>> print("c4c > 3", c4c > 3)
+c4c > 3 True
+>>> print("3 < c4c", 3 < c4c)
+3 < c4c True
+>>> Card(2, '\u2660') != Card(2, '\u2665')
+False
 """
 
-@total_ordering
+def _card2_compare(op: Callable[[int, int], bool], rank: int, other: Any) -> Any:
+    """op applied to a Card2's rank and other's rank, or NotImplemented.
+    Exact type checks come first; isinstance() is only for subclasses."""
+    t = type(other)
+    if t is Card2:
+        return op(rank, other[0])
+    if t is int:
+        return op(rank, other)
+    if isinstance(other, Card2):
+        return op(rank, other[0])
+    if isinstance(other, int):
+        return op(rank, other)
+    return NotImplemented
+
 class Card2(NamedTuple):
     rank: int
     suit: str
     def __str__(self) -> str:
         return "{0.rank}{0.suit}".format(self)
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, Card2):
-            return self.rank == other.rank
-        elif isinstance(other, int):
-            return self.rank == other
-        return NotImplemented
+        return _card2_compare(eq, self[0], other)
+    def __ne__(self, other: Any) -> bool:
+        return _card2_compare(ne, self[0], other)
     def __lt__(self, other: Any) -> bool:
-        if isinstance(other, Card2):
-            return self.rank < other.rank
-        elif isinstance(other, int):
-            return self.rank < other
-        return NotImplemented
+        return _card2_compare(lt, self[0], other)
+    def __le__(self, other: Any) -> bool:
+        return _card2_compare(le, self[0], other)
+    def __gt__(self, other: Any) -> bool:
+        return _card2_compare(gt, self[0], other)
+    def __ge__(self, other: Any) -> bool:
+        return _card2_compare(ge, self[0], other)
     
 test_eq_2 = """
 >>> c2s = Card2(2, '\u2660')
@@ -184,19 +205,16 @@ True
 """
 
 extra_comparisons_2 = """
-These don't work, the logic doesn't fit with total_ordering.
+With all six comparisons written out (rather than derived by
+total_ordering), the int comparisons work in both directions.
 
 >>> c4c= Card2(4, '\u2663')
->>> try:
-...     print("c4c > 3", c4c > 3)
-... except TypeError as e:
-...     print(e)
-'>' not supported between instances of 'Card2' and 'int'
->>> try:
-...     print("3 < c4c", 3 < c4c)
-... except TypeError as e:
-...     print(e)
-'<' not supported between instances of 'int' and 'Card2'
+>>> print("c4c > 3", c4c > 3)
+c4c > 3 True
+>>> print("3 < c4c", 3 < c4c)
+3 < c4c True
+>>> Card2(2, '\u2660') != Card2(2, '\u2665')
+False
 """
 
 __test__ = {
@@ -7,6 +7,24 @@ Chapter 10, Example Set 3
 
 from functools import partial
 
+# Specialized further: every power of two we'll ask for, precomputed.
+POW2 = tuple(1 << i for i in range(1024))
+def exp2_fast(n: int) -> int:
+    """2**n from the table for 0 <= n < 1024; other n go to 1 << n.
+
+    >>> exp2_fast(12)
+    4096
+    >>> exp2_fast(1024) == 2**1024
+    True
+    >>> exp2_fast(-1)
+    Traceback (most recent call last):
+    ...
+    ValueError: negative shift count
+    """
+    if 0 <= n < 1024:
+        return POW2[n]
+    return 1 << n
+
 def performance():
     import timeit
     f1 = timeit.timeit("""exp2(12)""", setup="""
@@ -17,6 +35,14 @@ exp2 = partial(pow, 2)""")
     f2 = timeit.timeit("""exp2(12)""", """exp2 = lambda y: pow(2, y)""")
     print("lambda", f2)
 
+    # For an integer 2**y, a shift is cheaper than pow(); a table
+    # lookup skips the arithmetic altogether.
+    f3 = timeit.timeit("""exp2(12)""", """exp2 = lambda y: 1 << y""")
+    print("shift", f3)
+
+    f4 = timeit.timeit("""exp2_fast(12)""", """from ch10_ex3 import exp2_fast""")
+    print("table", f4)
+
 test_correctness = """
 >>> exp2 = partial(pow, 2)
 >>> exp2(12)
@@ -28,6 +54,10 @@ test_correctness = """
 4096
 >>> exp2(17)-1
 131071
+>>> exp2_fast(12)
+4096
+>>> exp2_fast(17)-1
+131071
 """
 
 __test__ = {
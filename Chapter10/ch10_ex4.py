@@ -8,11 +8,19 @@ Chapter 10, Example Set 4
 from functools import reduce, partial
 
 display = lambda data: reduce(lambda x, y: print(x, y), data)
-sum2 = lambda data: reduce(lambda x, y: x+y**2, data, 0)
-sum = lambda data: reduce(lambda x, y: x+y, data, 0)
-count = lambda data: reduce(lambda x, y: x+1, data, 0)
-min = lambda data: reduce(lambda x, y: x if x < y else y, data)
-max = lambda data: reduce(lambda x, y: x if x > y else y, data)
+sum2_reduce = lambda data: reduce(lambda x, y: x+y**2, data, 0)
+sum_reduce = lambda data: reduce(lambda x, y: x+y, data, 0)
+count_reduce = lambda data: reduce(lambda x, y: x+1, data, 0)
+min_reduce = lambda data: reduce(lambda x, y: x if x < y else y, data)
+max_reduce = lambda data: reduce(lambda x, y: x if x > y else y, data)
+
+# The same reductions, with the per-item work done by the C builtins.
+import builtins
+sum2 = lambda data: builtins.sum(y*y for y in data)
+sum = lambda data: builtins.sum(data, 0)
+count = lambda data: builtins.sum(1 for _ in data)
+min = lambda data: builtins.min(data)
+max = lambda data: builtins.max(data)
 
 test_reductions = """
 >>> import math
@@ -31,6 +39,9 @@ test_reductions = """
 9
 >>> min(d)
 2
+
+>>> (sum2_reduce(d), sum_reduce(d), count_reduce(d), min_reduce(d), max_reduce(d))
+(232, 40, 8, 2, 9)
 """
 
 from typing import Callable, Iterable, TypeVar
@@ -96,7 +107,7 @@ def clean_sum(
     >>> clean_sum(comma_fix, d)
     14415.0
     """
-    return reduce(operator.add, map(cleaner, data))
+    return builtins.sum(map(cleaner, data))
 
 sum_p = partial(reduce, operator.add)
 
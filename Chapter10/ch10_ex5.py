@@ -4,7 +4,6 @@
 Chapter 10, Example Set 5
 """
 
-from collections import defaultdict
 from typing import (
     Iterable, Callable, Dict, List, TypeVar,
     Iterator, Tuple, cast)
@@ -13,13 +12,12 @@ K_ = TypeVar("K_")
 def partition(
         source: Iterable[D_],
         key: Callable[[D_], K_] = lambda x: cast(K_, x)
-    ) -> Iterable[Tuple[K_, Iterator[D_]]]:
+    ) -> Iterable[Tuple[K_, List[D_]]]:
     """Sort not required."""
-    pd: Dict[K_, List[D_]] = defaultdict(list)
+    pd: Dict[K_, List[D_]] = {}
     for item in source:
-        pd[key(item)].append(item)
-    for k in sorted(pd):
-        yield k, iter(pd[k])
+        pd.setdefault(key(item), []).append(item)
+    yield from sorted(pd.items())
 
 from itertools import groupby
 
@@ -60,10 +58,21 @@ Item = Tuple[K_, float]
 def summarize(
         key_iter: Tuple[K_, Iterable[Item]]
     ) -> Tuple[K_, float, float]:
+    """Mean and ``var`` of a group in one pass.
+
+    Welford's running update: ``m2`` accumulates ``sum((x-m)**2)``
+    without a second walk over the values.
+    """
     key, item_iter = key_iter
-    values = tuple(v for k, v in item_iter)
-    m = mean(values)
-    return key, m, var(m, values)
+    n = 0
+    m = 0.0
+    m2 = 0.0
+    for _, v in item_iter:
+        n += 1
+        delta = v - m
+        m += delta/n
+        m2 += delta*(v - m)
+    return key, m, m2/m
 
 test_summarize = """
 >>> data = [('4', 6.1), ('1', 4.0), ('2', 8.3), ('2', 6.5), ('1', 4.6),
@@ -89,6 +98,10 @@ test_summarize = """
 3 8.56 0.89
 4 5.5 0.7
 
+>>> values = [v for k, v in data if k == '3']
+>>> _, m, v = summarize(('3', [('3', x) for x in values]))
+>>> abs(m - mean(values)) < 1e-12, abs(v - var(mean(values), values)) < 1e-12
+(True, True)
 
 """
 
@@ -19,10 +19,7 @@ def row_iter_tab( source ):
     rdr= csv.reader( source, delimiter="\t" )
     return rdr
 def pieces(grouped):
-    for row in grouped:
-        yield from ((row[0][-1], float(v)) for v in row[1:])
-        #for t in ((row[0][-1], float(v)) for v in row[1:]):
-        #    yield t
+    return [(row[0][-1], float(v)) for row in grouped for v in row[1:]]
 
 if __name__ == "__main__":
     grouped= tuple( row_iter_tab(io.StringIO(raw_data)))
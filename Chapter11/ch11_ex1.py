@@ -14,9 +14,11 @@ FuncType = Callable[..., Any]
 F = TypeVar('F', bound=FuncType)
 
 def nullable(function: F) -> F:
+    # Binding function as a default makes it a fast local, not a cell;
+    # keyword-only, so a stray positional argument can't replace it.
     @wraps(function)
-    def null_wrapper(arg: Optional[Any]) -> Optional[Any]:
-        return None if arg is None else function(arg)
+    def null_wrapper(arg: Optional[Any], *, _f: F = function) -> Optional[Any]:
+        return None if arg is None else _f(arg)
     return cast(F, null_wrapper)
 
 @nullable
@@ -36,6 +38,10 @@ test_Null_Log = """
 >>> scaled = map( nlog, some_data )
 >>> [nround4(v) for v in scaled]
 [2.3026, 4.6052, None, 3.912, 4.0943]
+>>> nround4(3.14159, str)  # doctest: +IGNORE_EXCEPTION_DETAIL
+Traceback (most recent call last):
+...
+TypeError: takes 1 positional argument but 2 were given
 """
 
 nlog = nullable(math.log)
@@ -74,9 +80,9 @@ unsupported operand type(s) for divmod(): 'str' and 'str'
 
 import logging
 def logged(function: F) -> F:
+    log = logging.getLogger(function.__qualname__)
     @wraps(function)
     def log_wrapper(*args, **kw):
-        log = logging.getLogger(function.__qualname__)
         try:
             result = function(*args, **kw)
             log.info("(%r %r) => %r", args, kw, result)
@@ -101,15 +107,13 @@ TypeError: unsupported operand type(s) for divmod(): 'int' and 'NoneType'
 INFO:divmod:((22, 7) {}) => (3, 1)
 """
 
-import decimal
 def bad_data(function: F) -> F:
     @wraps(function)
     def wrap_bad_data(text: str, *args: Any, **kw: Any) -> Any:
-        try:
-            return function(text, *args, **kw)
-        except (ValueError, decimal.InvalidOperation):
-            cleaned = text.replace(",", "")
-            return function(cleaned, *args, **kw)
+        # Test for commas up front rather than waiting for a raise.
+        if isinstance(text, str) and "," in text:
+            text = text.replace(",", "")
+        return function(text, *args, **kw)
     return cast(F, wrap_bad_data)
 
 from decimal import Decimal
@@ -135,22 +139,17 @@ Decimal('19')
 Decimal('1956')
 """
 
-from typing import Tuple
-def clean_list(text: str, char_list: Tuple[str, ...]) -> str:
-    if char_list:
-        return clean_list(text.replace(char_list[0], ""), char_list[1:])
-    return text
-
 import decimal
 def bad_char_remove(*char_list: str) -> Callable[[F], F]:
+    # One translate() pass deletes every bad character.
+    drop_table = str.maketrans("", "", "".join(char_list))
+    drop_chars = frozenset(char_list)
     def cr_decorator(function: F) -> F:
         @wraps(function)
         def wrap_char_remove(text, *args, **kw):
-            try:
-                return function(text, *args, **kw)
-            except (ValueError, decimal.InvalidOperation):
-                cleaned = clean_list(text, char_list)
-                return function(cleaned, *args, **kw)
+            if isinstance(text, str) and not drop_chars.isdisjoint(text):
+                text = text.translate(drop_table)
+            return function(text, *args, **kw)
         return cast(F, wrap_char_remove)
     return cr_decorator
 
@@ -185,9 +184,11 @@ def then_convert(convert_function: CF) -> Callable[[Callable], CF]:
         return cast(F, cc_wrapper)
     return cast(Callable[[Callable], CF], abstract_decorator)
 
+DROP_PUNCT_TABLE = str.maketrans("", "", ",$")
+
 @then_convert(int)
 def drop_punct(text):  # Callable[[str], str] is Not the *real* signature!
-    return text.replace(",", "").replace("$", "")
+    return text.translate(DROP_PUNCT_TABLE)
 
 # reveal_type(drop_punct)
 
@@ -227,7 +228,7 @@ def cleanse_before(
     return abstract_decorator
 
 def drop_punct2(text: str) -> str:
-    return text.replace(",", "").replace("$", "")
+    return text.translate(DROP_PUNCT_TABLE)
 
 @cleanse_before(drop_punct)
 def to_int(text: str, base: int = 10) -> int:
@@ -251,7 +252,8 @@ test_cleanse_before = """
 """
 
 def normalize(mean, stdev):
-    z_score = lambda x: (x-mean)/stdev
+    inv_stdev = 1/stdev
+    z_score = lambda x: (x-mean)*inv_stdev
     def concrete_decorator(function):
         @wraps(function)
         def wrapped(data_arg):
@@ -5,12 +5,36 @@ Chapter 12, Example Set 1
 """
 import math
 
+# Stirling series coefficients in powers of 1/n, folded to constants.
+_C1 = 1/12
+_C2 = 1/288
+_C3 = -139/51840
+_C4 = -571/2488320
+_SQRT_2PI = math.sqrt(2*math.pi)
+
 def some_function(n: float) -> float:
     """
     An approximation of the gamma function.
 
+    The series is evaluated by Horner's rule on precomputed
+    coefficients: no tuple, no ``sum()``, and no constant
+    subexpressions recomputed per call.
+
     >>> round(some_function(4), 3)
     24.0
+    >>> abs(some_function(4.5) - some_function_series(4.5)) < 1e-12
+    True
+    """
+    t = 1/n
+    s = 1 + t*(_C1 + t*(_C2 + t*(_C3 + t*_C4)))
+    return _SQRT_2PI*math.sqrt(n)*(n/math.e)**n*s
+
+def some_function_series(n: float) -> float:
+    """
+    The same approximation, written out term by term.
+
+    >>> round(some_function_series(4), 3)
+    24.0
     """
     s = sum(
         (
@@ -36,7 +60,7 @@ def performance():
     import timeit
     t = timeit.timeit(
         """some_function(4)""",
-        """from Chapter_12.ch12_ex1 import some_function"""
+        """from Chapter12.ch12_ex1 import some_function"""
     )
 
     print(f"total time {t:.3f} sec. for 1,000,000 iterations")
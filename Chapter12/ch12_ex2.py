@@ -7,6 +7,7 @@ Chapter 12, Example Set 2
 
 import glob
 import re
+from itertools import chain
 import ftplib
 import gzip
 import datetime
@@ -32,6 +33,40 @@ sample = """\
 
 # Stage I: Lines of source.
 
+# ISA-L's inflate is a drop-in for gzip.open(), when it's installed.
+try:
+    from isal.igzip import open as gzip_open
+except ImportError:
+    gzip_open = gzip.open
+
+import io
+READ_BUFFER_SIZE = 128*1024
+
+def open_log(zip_file: str) -> io.BufferedReader:
+    """Decompressed bytes, read from the gzip stream in 128 KiB chunks."""
+    return io.BufferedReader(gzip_open(zip_file, "rb"), READ_BUFFER_SIZE)
+
+from typing import BinaryIO, Iterator
+def iter_lines(log: BinaryIO, size: int = READ_BUFFER_SIZE) -> Iterator[str]:
+    """
+    Cleaned lines from large reads: each chunk is decoded once and
+    split in C, rather than one readline() and decode() per line.
+
+    >>> list(iter_lines(io.BytesIO(b"a \\nb\\n\\nc"), size=3))
+    ['a', 'b', '', 'c']
+    """
+    tail = ""
+    while True:
+        chunk = log.read(size)
+        if not chunk:
+            break
+        lines = (tail + chunk.decode('us-ascii')).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line.rstrip()
+    if tail:
+        yield tail.rstrip()
+
 from typing import Iterator
 def local_gzip(pattern: str) -> Iterator[Iterator[str]]:
     """
@@ -43,8 +78,8 @@ def local_gzip(pattern: str) -> Iterator[Iterator[str]]:
     print()
     sys.stdout.flush()
     for zip_file in zip_logs:
-        with gzip.open(zip_file, "rb") as log:
-            yield (line.decode('us-ascii').rstrip() for line in log)
+        with open_log(zip_file) as log:
+            yield iter_lines(log)
 
 from typing import Iterator
 def remote_source(**credentials) -> Iterator[Iterator[str]]:
@@ -74,10 +109,45 @@ from typing import Iterator
 def local_gzip2(pattern: str) -> Iterator[Iterator[str]]:
     def line_iter(zip_file: str) -> Iterator[str]:
         """Opens and returns iterator over cleaned lines."""
-        log = gzip.open(zip_file, "rb")
-        return (line.decode('us-ascii').rstrip() for line in log)
+        log = open_log(zip_file)
+        return iter_lines(log)
     return map(line_iter, glob.glob(pattern))
 
+import mmap
+from typing import Iterator
+def mmap_lines(buffer: mmap.mmap) -> Iterator[str]:
+    """
+    Cleaned lines, found with find() on the mapped bytes; the OS
+    page cache does the reading.
+
+    >>> buffer = mmap.mmap(-1, 7)
+    >>> _ = buffer.write(b"a \\nb\\n\\nc")
+    >>> list(mmap_lines(buffer))
+    ['a', 'b', '', 'c']
+    """
+    start = 0
+    while True:
+        end = buffer.find(b"\n", start)
+        if end < 0:
+            break
+        yield buffer[start:end].decode('us-ascii').rstrip()
+        start = end+1
+    if start < len(buffer):
+        yield buffer[start:].decode('us-ascii').rstrip()
+
+from typing import Iterator
+def local_mmap(pattern: str) -> Iterator[Iterator[str]]:
+    """
+    Local, already decompressed log files, memory-mapped.
+    Yields a sequence of iterators over lines, one for each file.
+    """
+    for log_file in glob.glob(pattern):
+        if os.path.getsize(log_file) == 0:
+            continue
+        with open(log_file, 'rb') as log:
+            with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield mmap_lines(buffer)
+
 test_local_gzip = """
 >>> file_iter = local_gzip( "example.log.gz" )
 >>> data= tuple(next(file_iter))
@@ -97,6 +167,16 @@ test_local_gzip2 = """
 [187, 144, 317, 266, 258, 335, 559, 336]
 """
 
+test_local_mmap = """
+>>> import shutil, tempfile
+>>> with tempfile.TemporaryDirectory() as temp:
+...     with open_log("example.log.gz") as log, open(temp+"/example.log", "wb") as plain:
+...         shutil.copyfileobj(log, plain)
+...     for log in local_mmap(temp+"/*.log"):
+...         print( [len(line) for line in log] )
+[187, 144, 317, 266, 258, 335, 559, 336]
+"""
+
 def sample_data():
     """Read lines for unit tests, below."""
     yield sample.splitlines()
@@ -110,6 +190,8 @@ test_sample_data = """
 
 # Stage II: Access objects
 
+# The groups are in Access field order, so match.groups() feeds
+# Access._make() directly, with no groupdict() or keyword parsing.
 format_pat = re.compile(
     r"(?P<host>[\d\.]+)\s+"
     r"(?P<identity>\S+)\s+"
@@ -136,6 +218,83 @@ class Access(NamedTuple):
     referer: str
     user_agent: str
 
+import socket
+def parse_ipv4(host: str) -> int:
+    """
+    A dotted-quad address as a 32-bit int, parsed by inet_pton() in C.
+    format_pat accepts any run of digits and dots as a host, so
+    anything that isn't a valid IPv4 address raises ValueError.
+
+    >>> parse_ipv4('99.49.32.197')
+    1664164037
+    >>> format_ipv4(1664164037)
+    '99.49.32.197'
+    >>> parse_ipv4('300.1.2.3')
+    Traceback (most recent call last):
+    ...
+    ValueError: not an IPv4 address: '300.1.2.3'
+    """
+    try:
+        packed = socket.inet_pton(socket.AF_INET, host)
+    except OSError:
+        raise ValueError(f"not an IPv4 address: {host!r}") from None
+    return int.from_bytes(packed, 'big')
+
+def format_ipv4(host_u32: int) -> str:
+    """The dotted-quad string for an address from parse_ipv4()."""
+    return socket.inet_ntoa(host_u32.to_bytes(4, 'big'))
+
+from typing import Optional
+def tokenize_line(line: str) -> Optional[Access]:
+    """
+    Split a line at the fixed delimiters of the log format with
+    str.split() and str.find(), without the regex engine's backtracking.
+    Returns None for anything unusual -- other whitespace, doubled
+    spaces, a field that doesn't check out -- so the caller can fall
+    back to format_pat, which gives the same Access for every line
+    this accepts.
+
+    >>> all(
+    ...     tokenize_line(line) == Access._make(format_pat.match(line).groups())
+    ...     for log in sample_data() for line in log)
+    True
+    >>> tokenize_line('1.2.3.4 - -  [x] "GET / HTTP/1.1" 200 1 "-" "a"') is None
+    True
+    """
+    if "  " in line or not line.isprintable():
+        return None
+    fields = line.split(" ", 3)
+    if len(fields) != 4:
+        return None
+    host, identity, user, rest = fields
+    if (not host or host.strip("0123456789.") or not identity or not user
+            or rest[:1] != "["):
+        return None
+    time_end = rest.find('] "', 2)
+    if time_end < 0:
+        return None
+    request_end = rest.find('" ', time_end+4)
+    if request_end < 0:
+        return None
+    fields = rest[request_end+2:].split(" ", 2)
+    if len(fields) != 3:
+        return None
+    status, size, tail = fields
+    if not status.isdecimal() or not size or tail[:1] != '"':
+        return None
+    referer_end = tail.find('" "', 1)
+    if referer_end < 0:
+        return None
+    agent_end = tail.find('"', referer_end+4)
+    if agent_end < 0:
+        return None
+    return Access(
+        host, identity, user,
+        rest[1:time_end], rest[time_end+3:request_end],
+        status, size,
+        tail[1:referer_end], tail[referer_end+3:agent_end]
+    )
+
 from typing import Iterator
 def access_iter(source_iter: Iterator[Iterator[str]]) -> Iterator[Access]:
     """
@@ -144,9 +303,35 @@ def access_iter(source_iter: Iterator[Iterator[str]]) -> Iterator[Access]:
     """
     for log in source_iter:
         for line in log:
-            match = format_pat.match(line)
-            if match:
-                yield Access(**match.groupdict())
+            access = tokenize_line(line)
+            if access is None:
+                match = format_pat.match(line)
+                if not match:
+                    continue
+                access = Access._make(match.groups())
+            yield access
+
+# The same pattern for scanning a whole file at once.
+# Anchored at each line start, and \s may not cross a newline.
+format_block_pat = re.compile(
+    "^" + format_pat.pattern.replace(r"\s", r"[^\S\n]"),
+    re.MULTILINE
+)
+
+from typing import Iterator
+def access_iter_block(source_iter: Iterator[Iterator[str]]) -> Iterator[Access]:
+    """
+    Like access_iter(), but each file's lines are joined and scanned
+    with one finditer() call, so the regex engine walks the text in C
+    rather than being invoked once per line from Python.
+
+    >>> list(access_iter_block(sample_data())) == list(access_iter(sample_data()))
+    True
+    """
+    for log in source_iter:
+        text = "\n".join(log)
+        for match in format_block_pat.finditer(text):
+            yield Access._make(match.groups())
 
 from typing import Iterator, Optional
 def access_iter2(source_iter: Iterator[Iterator[str]]) -> Iterator[Access]:
@@ -158,7 +343,7 @@ def access_iter2(source_iter: Iterator[Iterator[str]]) -> Iterator[Access]:
         """Conditionally creates Access object if the line matches."""
         match = format_pat.match(line)
         if match:
-            return Access(**match.groupdict())
+            return Access._make(match.groups())
         return None
     return filter(
         None,
@@ -210,22 +395,75 @@ class AgentDetails(NamedTuple):
     system: str
     platform_details_extensions: str
 
+# Built positionally, in field order, by the iterators below:
+# binding keyword arguments costs about twice as much per record.
 class AccessDetails(NamedTuple):
     access: Access
-    time: datetime.datetime
+    time: Optional[datetime.datetime]
     method: str
     url: urllib.parse.ParseResult
     protocol: str
-    referrer: urllib.parse.ParseResult
+    referrer: Optional[urllib.parse.ParseResult]
     agent: Optional[AgentDetails]
 
 from typing import Tuple
 def parse_request(request: str) -> Tuple[str, str, str]:
-    words = request.split()
-    return words[0], ' '.join(words[1:-1]), words[-1]
+    """
+    Method, URI and protocol: split at the first and last space.
+
+    >>> parse_request("GET /book/a b.html HTTP/1.1")
+    ('GET', '/book/a b.html', 'HTTP/1.1')
+    """
+    meth, _, rest = request.partition(' ')
+    uri, _, protocol = rest.rpartition(' ')
+    return meth, uri, protocol
 
 import datetime
+from typing import Dict
+MONTHS = {
+    name: number for number, name in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1)
+}
+TIMEZONES: Dict[str, datetime.timezone] = {}
+
 def parse_time(ts: str) -> datetime.datetime:
+    """
+    The log's timestamps are fixed-width ``dd/Mon/yyyy:HH:MM:SS +zzzz``,
+    so slice the fields out directly. Anything else goes to strptime(),
+    which either copes or raises the usual ValueError.
+
+    >>> parse_time("01/Jun/2012:22:17:54 -0400") == (
+    ...     datetime.datetime.strptime(
+    ...         "01/Jun/2012:22:17:54 -0400", "%d/%b/%Y:%H:%M:%S %z"))
+    True
+    >>> parse_time("1/Jun/2012:22:17:54 +0530").utcoffset()
+    datetime.timedelta(seconds=19800)
+    >>> parse_time("01/Jun/2012:22:17:54 -0475")
+    Traceback (most recent call last):
+    ...
+    ValueError: time data '01/Jun/2012:22:17:54 -0475' does not match format '%d/%b/%Y:%H:%M:%S %z'
+    """
+    try:
+        if len(ts) == 26 and ts[2]+ts[6]+ts[11]+ts[14]+ts[17]+ts[20] == "//::: ":
+            tz_key = ts[21:]
+            tz = TIMEZONES.get(tz_key)
+            if tz is None:
+                hours, minutes = int(tz_key[1:3]), int(tz_key[3:5])
+                if minutes >= 60 or not tz_key[1:].isdigit():
+                    raise ValueError(tz_key)
+                offset = datetime.timedelta(hours=hours, minutes=minutes)
+                if tz_key[0] == '-':
+                    offset = -offset
+                elif tz_key[0] != '+':
+                    raise ValueError(tz_key)
+                tz = TIMEZONES[tz_key] = datetime.timezone(offset)
+            return datetime.datetime(
+                int(ts[7:11]), MONTHS[ts[3:6]], int(ts[0:2]),
+                int(ts[12:14]), int(ts[15:17]), int(ts[18:20]),
+                tzinfo=tz)
+    except (KeyError, ValueError):
+        pass
     return datetime.datetime.strptime(ts, "%d/%b/%Y:%H:%M:%S %z")
 
 agent_pat = re.compile(
@@ -234,13 +472,27 @@ agent_pat = re.compile(
     r"(?P<platform_details_extensions>.*)"
 )
 
+# PyPy's JIT specializes these short pure functions well, and its
+# lru_cache is plain Python, so the memoizing below is CPython-only.
+import platform
+PYPY = platform.python_implementation() == "PyPy"
+
+from functools import lru_cache
 from typing import Optional
 def parse_agent(user_agent: str) -> Optional[AgentDetails]:
     agent_match = agent_pat.match(user_agent)
     if agent_match:
-        return AgentDetails(**agent_match.groupdict())
+        return AgentDetails._make(agent_match.groups())
     return None
 
+# Referers ("-", search engines) and paths repeat heavily in a log,
+# and ParseResult is immutable, so a cached urlparse is safe.
+if PYPY:
+    urlparse = urllib.parse.urlparse
+else:
+    parse_agent = lru_cache(maxsize=1 << 12)(parse_agent)
+    urlparse = lru_cache(maxsize=1 << 16)(urllib.parse.urlparse)
+
 from typing import Iterable, Iterator
 def access_detail_iter(access_iter: Iterable[Access]) -> Iterator[AccessDetails]:
     """Yields AccessDetails wrapped around the original Access objects."""
@@ -248,13 +500,13 @@ def access_detail_iter(access_iter: Iterable[Access]) -> Iterator[AccessDetails]
         try:
             meth, uri, protocol = parse_request(access.request)
             yield AccessDetails(
-                access=access,
-                time=parse_time(access.time),
-                method=meth,
-                url=urllib.parse.urlparse(uri),
-                protocol=protocol,
-                referrer=urllib.parse.urlparse(access.referer),
-                agent=parse_agent(access.user_agent)
+                access,
+                parse_time(access.time),
+                meth,
+                urlparse(uri),
+                protocol,
+                urlparse(access.referer),
+                parse_agent(access.user_agent)
             )
         except ValueError as e:
             print(e, repr(access))
@@ -265,19 +517,98 @@ def access_detail_iter2(access_iter: Iterable[Access]) -> Iterator[AccessDetails
         try:
             meth, uri, protocol = parse_request(access.request)
             return AccessDetails(
-                access=access,
-                time=parse_time(access.time),
-                method=meth,
-                url=urllib.parse.urlparse(uri),
-                protocol=protocol,
-                referrer=urllib.parse.urlparse(access.referer),
-                agent=parse_agent(access.user_agent)
+                access,
+                parse_time(access.time),
+                meth,
+                urlparse(uri),
+                protocol,
+                urlparse(access.referer),
+                parse_agent(access.user_agent)
             )
         except ValueError as e:
             print(e, repr(access))
         return None
     return filter(None, map(access_detail_builder, access_iter))
 
+_UNSET = object()
+
+class LazyAccessDetails:
+    """
+    AccessDetails with the costly fields parsed on first use.
+
+    The filters only look at ``url``, so for records they discard the
+    time, referrer and agent are never parsed at all.
+    """
+    __slots__ = ('access', 'method', 'url', 'protocol',
+                 '_time', '_referrer', '_agent')
+    def __init__(self, access: Access) -> None:
+        self.access = access
+        self.method, uri, self.protocol = parse_request(access.request)
+        self.url = urlparse(uri)
+        self._time = self._referrer = self._agent = _UNSET
+    @property
+    def time(self) -> datetime.datetime:
+        if self._time is _UNSET:
+            self._time = parse_time(self.access.time)
+        return self._time
+    @property
+    def referrer(self) -> urllib.parse.ParseResult:
+        if self._referrer is _UNSET:
+            self._referrer = urlparse(self.access.referer)
+        return self._referrer
+    @property
+    def agent(self) -> Optional[AgentDetails]:
+        if self._agent is _UNSET:
+            self._agent = parse_agent(self.access.user_agent)
+        return self._agent
+
+from typing import Iterable, Iterator
+def access_detail_iter_lazy(
+        access_iter: Iterable[Access]
+    ) -> Iterator[LazyAccessDetails]:
+    """
+    >>> lazy = list(access_detail_iter_lazy(access_iter(sample_data())))
+    >>> eager = list(access_detail_iter(access_iter(sample_data())))
+    >>> all(
+    ...     (l.access, l.time, l.method, l.url, l.protocol, l.referrer, l.agent)
+    ...     == tuple(e) for l, e in zip(lazy, eager))
+    True
+    >>> [d.url.path for d in book_filter(path_filter(lazy))] == [
+    ...     d.url.path for d in book_filter(path_filter(eager))]
+    True
+    """
+    for access in access_iter:
+        try:
+            yield LazyAccessDetails(access)
+        except ValueError as e:
+            print(e, repr(access))
+
+from typing import Iterable, Iterator
+def access_detail_iter_minimal(
+        access_iter: Iterable[Access]
+    ) -> Iterator[AccessDetails]:
+    """
+    AccessDetails with only the request parsed; the filters and the
+    book count never look at time, referrer or agent, so those are None.
+
+    >>> minimal = list(access_detail_iter_minimal(access_iter(sample_data())))
+    >>> eager = list(access_detail_iter(access_iter(sample_data())))
+    >>> [d.url for d in minimal] == [d.url for d in eager]
+    True
+    >>> minimal[0].agent is None
+    True
+    """
+    for access in access_iter:
+        try:
+            meth, uri, protocol = parse_request(access.request)
+            yield AccessDetails(
+                access, None, meth, urlparse(uri), protocol, None, None)
+        except ValueError as e:
+            print(e, repr(access))
+
+# For reporting, where time, referrer and agent are all needed.
+access_detail_iter_full = access_detail_iter
+
 test_access_detail_iter = """
 >>> data= list( access_detail_iter(access_iter( sample_data())))
 >>> len(data)
@@ -300,28 +631,41 @@ AccessDetails(access=Access(host='137.111.13.200', identity='-', user='-', time=
 
 # Stage IV: Reduce clutter
 
-from typing import Iterable, Iterator
-def path_filter(
-        access_details_iter: Iterable[AccessDetails]
-    ) -> Iterable[AccessDetails]:
-    name_exclude = {
+# Any path segment equal to one of these names, as a single regex.
+NAME_EXCLUDE_PAT = re.compile(
+    r"(?:^|/)(?:"
+    + "|".join(map(re.escape, (
         'favicon.ico', 'robots.txt', 'index.php', 'humans.txt',
         'a2test', 'ping',
         'dompdf.php', 'crossdomain.xml',
         '_images', 'search.html', 'genindex.html',
         'searchindex.js', 'modindex.html', 'py-modindex.html',
-    }
-    ext_exclude = {
-        '.png', '.js', '.css',
-    }
+    )))
+    + r")(?:/|$)"
+)
+EXT_EXCLUDE = frozenset({'png', 'js', 'css'})
+
+from typing import Iterable, Iterator
+def path_filter(
+        access_details_iter: Iterable[AccessDetails]
+    ) -> Iterable[AccessDetails]:
+    """
+    >>> from collections import namedtuple
+    >>> D = namedtuple("D", "url")
+    >>> paths = ["/", "/a/favicon.ico", "/ping/x", "/pinging", "/a.css",
+    ...     "/a.css/b", "/b/c.html", "x.png", "/png"]
+    >>> [d.url.path for d in path_filter(
+    ...     D(urllib.parse.urlparse(p)) for p in paths)]
+    ['/pinging', '/a.css/b', '/b/c.html', '/png']
+    """
     for detail in access_details_iter:
-        path = detail.url.path.split('/')
-        if not any(path):
+        path = detail.url.path
+        if not path.strip('/'):
             continue
-        if any(p in name_exclude for p in path):
+        if NAME_EXCLUDE_PAT.search(path):
             continue
-        final = path[-1]
-        if any(final.endswith(ext) for ext in ext_exclude):
+        _, dot, ext = path.rpartition('.')
+        if dot and ext in EXT_EXCLUDE:
             continue
         yield detail
 
@@ -329,36 +673,26 @@ from typing import Iterable, Iterator
 def path_filter2(
         access_details_iter: Iterable[AccessDetails]
     ) -> Iterable[AccessDetails]:
-    def non_empty_path(detail: AccessDetails) -> bool:
-        path = detail.url.path.split('/')
-        return any(path)
-    def non_excluded_names(detail: AccessDetails) -> bool:
-        "Exclude by name; include names not in a list."
-        name_exclude = {
-            'favicon.ico', 'robots.txt', 'index.php', 'humans.txt',
-            'a2test', 'ping',
-            'dompdf.php', 'crossdomain.xml',
-            '_images', 'search.html', 'genindex.html',
-            'searchindex.js', 'modindex.html', 'py-modindex.html',
-        }
-        path = detail.url.path.split('/')
-        return not any(p in name_exclude for p in path)
-    def non_excluded_ext(detail: AccessDetails) -> bool:
-        "Exclude by extension; include names not in a list."
-        ext_exclude = {
-            '.png', '.js', '.css',
-        }
+    name_exclude = {
+        'favicon.ico', 'robots.txt', 'index.php', 'humans.txt',
+        'a2test', 'ping',
+        'dompdf.php', 'crossdomain.xml',
+        '_images', 'search.html', 'genindex.html',
+        'searchindex.js', 'modindex.html', 'py-modindex.html',
+    }
+    ext_exclude = ('.png', '.js', '.css')
+    def included(detail: AccessDetails) -> bool:
+        """
+        A non-empty path, with no excluded name or extension.
+        The path is split once for all three tests.
+        """
         path = detail.url.path.split('/')
-        final = path[-1]
-        return not any(final.endswith(ext) for ext in ext_exclude)
-    ne = filter(non_empty_path, access_details_iter)
-    nx_name = filter(non_excluded_names, ne)
-    nx_ext = filter(non_excluded_ext, nx_name)
-    return nx_ext
-    # Yet another variation:
-    # return filter( non_excluded_ext,
-    #              filter( non_excluded_names,
-    #                     filter( non_empty_path, access_details_iter ) ) )
+        return (
+            any(path)
+            and name_exclude.isdisjoint(path)
+            and not path[-1].endswith(ext_exclude)
+        )
+    return filter(included, access_details_iter)
 
 test_path_filter = """
 >>> data= list( path_filter( access_detail_iter(access_iter( sample_data()))) )
@@ -398,10 +732,7 @@ def book_filter_opt(access_details_iter: Iterable[AccessDetails]) -> Iterator[Ac
 from typing import Iterable, Iterator, Dict
 from collections import Counter
 def reduce_book_total(access_details_iter: Iterable[AccessDetails]) -> Dict[str, int]:
-    counts: Dict[str, int] = Counter()
-    for detail in access_details_iter:
-        counts[detail.url.path] += 1
-    return counts
+    return Counter(detail.url.path for detail in access_details_iter)
 
 test_book_filter = """
 >>> details= path_filter( access_detail_iter(access_iter( sample_data())))
@@ -424,9 +755,53 @@ test_book_count = """
 [('/book/python-2.6/html/p02/p02c10_adv_seq.html', 1), ('/book/python-2.6/html/p04/p04c09_architecture.html', 1)]
 """
 
+# All four stages fused into one loop
+
+from typing import Iterable, Iterator
+def analyze_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Book paths from raw log lines: the access_iter, access_detail_iter,
+    path_filter and book_filter stages in one generator. Only the
+    request URL is parsed; time, agent and referrer are never needed
+    for the count, so no Access or AccessDetails objects are built.
+
+    >>> from itertools import chain
+    >>> staged = reduce_book_total(book_filter(path_filter(
+    ...     access_detail_iter(access_iter(sample_data())))))
+    >>> Counter(analyze_lines(chain.from_iterable(sample_data()))) == staged
+    True
+
+    A malformed request is reported and skipped, like access_detail_iter().
+
+    >>> good = next(sample_data())[0]
+    >>> bad = good.replace('GET /favicon.ico', 'GET http://[::1/book/x')
+    >>> list(analyze_lines([bad, good])) #doctest: +ELLIPSIS
+    Invalid IPv6 URL '99.49.32.197 - - ... "GET http://[::1/book/x HTTP/1.1" ...'
+    []
+    """
+    for line in lines:
+        match = format_pat.match(line)
+        if not match:
+            continue
+        try:
+            _, uri, _ = parse_request(match.group('request'))
+            path = urlparse(uri).path
+        except ValueError as e:
+            print(e, repr(line))
+            continue
+        if not path.strip('/') or NAME_EXCLUDE_PAT.search(path):
+            continue
+        _, dot, ext = path.rpartition('.')
+        if dot and ext in EXT_EXCLUDE:
+            continue
+        segments = [s for s in path.split('/') if s]
+        if segments[0] == 'book' and len(segments) > 1:
+            yield path
+
 __test__ = {
     "Stage I: test_local_gzip": test_local_gzip,
     "Stage I: test_local_gzip2": test_local_gzip2,
+    "Stage I: test_local_mmap": test_local_mmap,
     "Stage I: test_sample_data": test_sample_data,
 
     "Stage II: test_access_iter": test_access_iter,
@@ -449,14 +824,96 @@ def test(*args, **kw):
 
 def analysis(filename: str) -> Dict[str, int]:
     """Count book chapters in a given file"""
+    return Counter(analyze_lines(chain.from_iterable(local_gzip(filename))))
+
+def analysis_stages(filename: str) -> Dict[str, int]:
+    """Count book chapters in a given file, one stage at a time"""
     details = path_filter(
-        access_detail_iter(
+        access_detail_iter_minimal(
             access_iter(
                 local_gzip(filename))))
     books = book_filter(details)
     totals = reduce_book_total(books)
     return totals
 
+def precompile() -> None:
+    """
+    Worker initializer. The patterns are compiled at import, once per
+    process; this also pushes the sample lines through every stage, so
+    the lazy setup (strptime's own regexes, the urllib.parse caches)
+    is done before the first file rather than during it.
+
+    >>> precompile()
+    """
+    list(access_detail_iter(access_iter(sample_data())))
+    list(analyze_lines(chain.from_iterable(sample_data())))
+    datetime.datetime.strptime("01/Jun/2012:22:17:54 -0400", "%d/%b/%Y:%H:%M:%S %z")
+
+# Several workers per file: each inflates one byte range of the
+# uncompressed stream. This needs random access into the gzip file,
+# so it's only used when indexed_gzip is installed.
+try:
+    import indexed_gzip
+except ImportError:
+    indexed_gzip = None
+
+from typing import List, Tuple
+def split_ranges(size: int, nchunks: int) -> List[Tuple[int, int]]:
+    """
+    Split ``size`` bytes into ``nchunks`` contiguous (start, end) ranges.
+
+    >>> split_ranges(10, 3)
+    [(0, 4), (4, 7), (7, 10)]
+    """
+    step, extra = divmod(size, nchunks)
+    bounds = [i*step + min(i, extra) for i in range(nchunks+1)]
+    return list(zip(bounds, bounds[1:]))
+
+from typing import BinaryIO, Iterator
+def range_lines(log: BinaryIO, start: int, end: int) -> Iterator[str]:
+    """
+    Cleaned lines that begin in ``[start, end)``. A range that starts
+    mid-line skips forward to the next line; the range that holds the
+    start of that line reads past ``end`` to finish it.
+
+    >>> log = io.BytesIO(b"one\\ntwo \\nthree\\n")
+    >>> [list(range_lines(log, s, e)) for s, e in split_ranges(15, 3)]
+    [['one', 'two'], ['three'], []]
+    """
+    log.seek(max(start-1, 0))
+    if start > 0:
+        log.readline()
+    while log.tell() < end:
+        line = log.readline()
+        if not line:
+            break
+        yield line.decode('us-ascii').rstrip()
+
+def build_index(zip_file: str) -> Tuple[str, int]:
+    """Inflate once to save a seek point index; return it and the uncompressed size."""
+    index_file = zip_file + ".gzidx"
+    with indexed_gzip.IndexedGzipFile(zip_file) as log:
+        log.build_full_index()
+        log.export_index(index_file)
+        size = log.seek(0, io.SEEK_END)
+    return index_file, size
+
+def analysis_range(job: Tuple[str, str, int, int]) -> Dict[str, int]:
+    """Count book chapters in one byte range of a given file"""
+    zip_file, index_file, start, end = job
+    with indexed_gzip.IndexedGzipFile(zip_file, index_file=index_file) as log:
+        return Counter(analyze_lines(range_lines(log, start, end)))
+
+from typing import Iterable, Iterator
+def range_jobs(
+        zip_logs: Iterable[str], nchunks: int
+    ) -> Iterator[Tuple[str, str, int, int]]:
+    """One (file, index, start, end) job for each range of each file."""
+    for zip_file in zip_logs:
+        index_file, size = build_index(zip_file)
+        for start, end in split_ranges(size, nchunks):
+            yield zip_file, index_file, start, end
+
 def demo_mp(pool_size=None):
     """6 large files, 5 small files.
     Actual time 69.8 sec with pool of 4 or more workers.
@@ -469,8 +926,11 @@ def demo_mp(pool_size=None):
     pattern = root+"*itmaybeahack.com*.gz"
     pool_size = multiprocessing.cpu_count() if pool_size is None else pool_size
     combined = Counter()
-    with multiprocessing.Pool(pool_size) as workers:
-        for result in workers.imap_unordered(analysis, glob.glob(pattern)):
+    files = glob.glob(pattern)
+    # Big enough chunks to amortize the IPC, small enough to balance load.
+    chunksize = max(1, len(files)//(4*pool_size))
+    with multiprocessing.Pool(pool_size, initializer=precompile) as workers:
+        for result in workers.imap_unordered(analysis, files, chunksize):
             combined.update(result)
 
     end = time.perf_counter()
@@ -486,15 +946,17 @@ def demo_mp_async(pool_size=None):
 
     start = time.perf_counter()
 
+    from functools import reduce
+    from operator import iadd
     pattern = root+"*itmaybeahack.com*.gz"
-    combined = Counter()
     pool_size = multiprocessing.cpu_count() if pool_size is None else pool_size
-    with multiprocessing.Pool(pool_size) as workers:
+    with multiprocessing.Pool(pool_size, initializer=precompile) as workers:
         results = workers.map_async(analysis, glob.glob(pattern))
             # , callback=combined.update )
         data = results.get()
-        for c in data:
-            combined.update(c)
+        # iadd, not add: each step updates one Counter in place
+        # instead of copying the running total.
+        combined = reduce(iadd, data, Counter())
 
     end = time.perf_counter()
     print(combined)
@@ -526,14 +988,149 @@ def demo_cf_procs():
     pool_size = 4
     pattern = root+"*itmaybeahack.com*.gz"
     combined = Counter()
-    with concurrent.futures.ProcessPoolExecutor(max_workers=pool_size) as workers:
-        for result in workers.map(analysis, glob.glob(pattern)):
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=pool_size, initializer=precompile) as workers:
+        # Merge each file's counts as it finishes, not in input order.
+        futures = [workers.submit(analysis, f) for f in glob.glob(pattern)]
+        for future in concurrent.futures.as_completed(futures):
+            combined.update(future.result())
+
+    end = time.perf_counter()
+    print(combined)
+    print("time {0:.1f}, pool size {1:d}".format(end-start, pool_size))
+
+def demo_mp_ranges(pool_size=None):
+    """Like demo_mp, but the large files are split across the workers."""
+    import multiprocessing
+    root = "/Users/slott/Documents/Work/ItMayBeAHack/"
+
+    start = time.perf_counter()
+
+    pattern = root+"*itmaybeahack.com*.gz"
+    pool_size = multiprocessing.cpu_count() if pool_size is None else pool_size
+    combined = Counter()
+    files = glob.glob(pattern)
+    with multiprocessing.Pool(pool_size, initializer=precompile) as workers:
+        if indexed_gzip is None:
+            results = workers.imap_unordered(analysis, files)
+        else:
+            results = workers.imap_unordered(
+                analysis_range, range_jobs(files, pool_size))
+        for result in results:
             combined.update(result)
 
     end = time.perf_counter()
     print(combined)
     print("time {0:.1f}, pool size {1:d}".format(end-start, pool_size))
 
+# A pipeline: this process inflates, the workers parse.
+
+PIPELINE_CHUNK_SIZE = 1024*1024
+
+from typing import BinaryIO, Iterator
+def chunk_lines(log: BinaryIO, size: int = PIPELINE_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Blocks of about ``size`` bytes, each ending at a line boundary.
+
+    >>> list(chunk_lines(io.BytesIO(b"ab\\ncd\\nef"), size=4))
+    [b'ab\\n', b'cd\\n', b'ef']
+    """
+    tail = b""
+    while True:
+        chunk = log.read(size)
+        if not chunk:
+            break
+        cut = chunk.rfind(b"\n")
+        if cut < 0:
+            tail += chunk
+            continue
+        yield tail + chunk[:cut+1]
+        tail = chunk[cut+1:]
+    if tail:
+        yield tail
+
+def count_chunks(chunks, results) -> None:
+    """
+    Worker: count book chapters in each block from the ``chunks``
+    queue until the None sentinel, then put the one Counter on ``results``.
+    """
+    precompile()
+    totals = Counter()
+    for chunk in iter(chunks.get, None):
+        lines = chunk.decode('us-ascii').split("\n")
+        totals.update(analyze_lines(line.rstrip() for line in lines))
+    results.put(totals)
+
+def check_workers(workers) -> None:
+    """Raise if any worker process has already died."""
+    failed = [w for w in workers if w.exitcode not in (None, 0)]
+    if failed:
+        raise RuntimeError(
+            f"{len(failed)} worker(s) failed, exit code {failed[0].exitcode}")
+
+def put_checked(chunks, item, workers, poll: float = 1.0) -> None:
+    """Queue an item, without blocking forever if the workers are gone."""
+    import queue
+    while True:
+        try:
+            chunks.put(item, timeout=poll)
+            return
+        except queue.Full:
+            check_workers(workers)
+
+def gather_results(results, workers, poll: float = 1.0) -> List[Counter]:
+    """One Counter per worker; raises rather than waiting on a dead one."""
+    import queue
+    gathered: List[Counter] = []
+    while len(gathered) < len(workers):
+        try:
+            gathered.append(results.get(timeout=poll))
+        except queue.Empty:
+            check_workers(workers)
+    return gathered
+
+def demo_mp_pipeline(pool_size=None):
+    """
+    Inflating and parsing overlap: the queue is bounded, so the
+    reader stays at most a few blocks ahead of the workers.
+    """
+    import multiprocessing
+    from functools import reduce
+    from operator import iadd
+    root = "/Users/slott/Documents/Work/ItMayBeAHack/"
+
+    start = time.perf_counter()
+
+    pattern = root+"*itmaybeahack.com*.gz"
+    pool_size = multiprocessing.cpu_count() if pool_size is None else pool_size
+    chunks = multiprocessing.Queue(maxsize=4*pool_size)
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=count_chunks, args=(chunks, results))
+        for _ in range(pool_size)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        for zip_file in glob.glob(pattern):
+            with open_log(zip_file) as log:
+                for chunk in chunk_lines(log):
+                    put_checked(chunks, chunk, workers)
+        for _ in workers:
+            put_checked(chunks, None, workers)
+        combined = reduce(iadd, gather_results(results, workers), Counter())
+    except BaseException:
+        # A failed reader or worker: don't leave the others waiting.
+        for worker in workers:
+            worker.terminate()
+        raise
+    for worker in workers:
+        worker.join()
+
+    end = time.perf_counter()
+    print(combined)
+    print("time {0:.1f}, pool size {1:d}".format(end-start, pool_size))
+
 def benchmark():
     """
     6 large files, 5 small files.
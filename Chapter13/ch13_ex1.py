@@ -22,8 +22,10 @@ year_cheese = [
 
 from typing import Callable, Sequence, TypeVar
 T_ = TypeVar("T_")
-fst: Callable[[Sequence[T_]], T_] = lambda x: x[0]
-snd: Callable[[Sequence[T_]], T_] = lambda x: x[1]
+# The lambda forms were: lambda x: x[0] and lambda x: x[1]
+from operator import itemgetter, attrgetter
+fst: Callable[[Sequence[T_]], T_] = itemgetter(0)
+snd: Callable[[Sequence[T_]], T_] = itemgetter(1)
 
 x = min(year_cheese, key=snd)
 
@@ -48,6 +50,9 @@ class YearCheese(NamedTuple):
 
 year_cheese_2 = list(YearCheese(*yc) for yc in year_cheese)
 
+# Built once, for use as a key in any number of min() or max() calls.
+cheese = attrgetter('cheese')
+
 test_year_cheese_2 = """
 >>> year_cheese_2  # doctest: +NORMALIZE_WHITESPACE
 [YearCheese(year=2000, cheese=29.87), YearCheese(year=2001, cheese=30.12),
@@ -64,6 +69,8 @@ test_attrgetter = """
 YearCheese(year=2000, cheese=29.87)
 >>> max( year_cheese_2, key=lambda x: x.cheese )
 YearCheese(year=2007, cheese=33.5)
+>>> max( year_cheese_2, key=cheese )
+YearCheese(year=2007, cheese=33.5)
 """
 
 g_f = [
@@ -108,30 +115,29 @@ test_starmap2 = """
 3.1415925925925925
 """
 
-def fact(n: int) -> int:
-    """
-    >>> fact(0)
-    1
-    >>> fact(1)
-    1
-    >>> fact(2)
-    2
-    >>> fact(3)
-    6
-    >>> fact(4)
-    24
-    """
-    f = {
-        n == 0: lambda n: 1,
-        n == 1: lambda n: 1,
-        n == 2: lambda n: 2,
-        n > 2: lambda n: fact(n-1)*n
-    }[True]
-    return f(n)
+# The factorial is in the standard library, implemented in C.
+from math import factorial as fact
 
-from typing import Callable, Tuple, List
+test_fact = """
+>>> [fact(n) for n in range(5)]
+[1, 1, 2, 6, 24]
+"""
 
-from operator import itemgetter
+test_fact_dict = """
+>>> def fact(n: int) -> int:
+...     f = {
+...         n == 0: lambda n: 1,
+...         n == 1: lambda n: 1,
+...         n == 2: lambda n: 2,
+...         n > 2: lambda n: fact(n-1)*n
+...     }[True]
+...     return f(n)
+>>> fact(4)
+24
+"""
+
+from functools import lru_cache
+from operator import mul
 def semifact(n: int) -> int:
     """
     >>> semifact(0)
@@ -149,28 +155,53 @@ def semifact(n: int) -> int:
     >>> semifact(9)
     945
     """
-    alternatives: List[Tuple[bool, Callable[[int], int]]] = [
-        (n == 0, lambda n: 1),
-        (n == 1, lambda n: 1),
-        (n == 2, lambda n: 2),
-        (n > 2, lambda n: semifact(n-2)*n)
-    ]
-    _, f = next(filter(itemgetter(0), alternatives))
-    return f(n)
+    return reduce(mul, range(n, 0, -2), 1)
+
+@lru_cache(maxsize=None)
+def _semifact_recursive(n: int) -> int:
+    """
+    >>> _semifact_recursive(9) == semifact(9)
+    True
+    """
+    return 1 if n < 2 else 2 if n == 2 else n*_semifact_recursive(n-2)
 
+test_semifact_itemgetter = """
+>>> from typing import Callable, Tuple, List
+>>> from operator import itemgetter
+>>> def semifact(n: int) -> int:
+...     alternatives: List[Tuple[bool, Callable[[int], int]]] = [
+...         (n == 0, lambda n: 1),
+...         (n == 1, lambda n: 1),
+...         (n == 2, lambda n: 2),
+...         (n > 2, lambda n: semifact(n-2)*n)
+...     ]
+...     _, f = next(filter(itemgetter(0), alternatives))
+...     return f(n)
+>>> semifact(9)
+945
+"""
+
+@lru_cache(maxsize=None)
 def semifact2(n: int) -> int:
     """
     >>> semifact2(9)
     945
     """
-    alternatives = [
-        (lambda n: 1) if n == 0 else None,
-        (lambda n: 1) if n == 1 else None,
-        (lambda n: 2) if n == 2 else None,
-        (lambda n: semifact2(n-2)*n) if n > 2 else None
-    ]
-    f = next(filter(None, alternatives))
-    return f(n)
+    return 1 if n < 2 else 2 if n == 2 else semifact2(n-2)*n
+
+test_semifact_filter = """
+>>> def semifact2(n: int) -> int:
+...     alternatives = [
+...         (lambda n: 1) if n == 0 else None,
+...         (lambda n: 1) if n == 1 else None,
+...         (lambda n: 2) if n == 2 else None,
+...         (lambda n: semifact2(n-2)*n) if n > 2 else None
+...     ]
+...     f = next(filter(None, alternatives))
+...     return f(n)
+>>> semifact2(9)
+945
+"""
 
 # Here's a "stub" definition for a class that includes
 # the minimal feature set for comparison.
@@ -201,8 +232,15 @@ def non_strict_max(a: RT, b: RT) -> RT:
     >>> non_strict_max( 11, 7 )
     11
     """
-    f = {a >= b: lambda: a, b >= a: lambda: b}[True]
-    return f()
+    return a if a >= b else b
+
+test_non_strict_max_dict = """
+>>> def non_strict_max(a, b):
+...     f = {a >= b: lambda: a, b >= a: lambda: b}[True]
+...     return f()
+>>> non_strict_max( 3, 5 )
+5
+"""
 
 test_starmap3 = """
 >>> from itertools import count, takewhile
@@ -244,6 +282,11 @@ __test__ = {
     "test_starmap1": test_starmap1,
     "test_starmap2": test_starmap2,
     "test_starmap3": test_starmap3,
+    "test_fact": test_fact,
+    "test_fact_dict": test_fact_dict,
+    "test_semifact_itemgetter": test_semifact_itemgetter,
+    "test_semifact_filter": test_semifact_filter,
+    "test_non_strict_max_dict": test_non_strict_max_dict,
     "test_reduction": test_reduction,
     "test_unordered": test_unordered,
 }
@@ -5,8 +5,7 @@ Chapter 14, Example Set 1
 """
 from pymonad import curry, Just, Nothing, List
 
-@curry
-def systolic_bp(bmi, age, gender_male, treatment):
+def systolic_bp_model(bmi, age, gender_male, treatment):
     """
     Example of multiple regression model.
 
@@ -16,6 +15,18 @@ def systolic_bp(bmi, age, gender_male, treatment):
         68.15+0.58*bmi+0.65*age+0.94*gender_male+6.44*treatment
     )
 
+systolic_bp = curry(systolic_bp_model)
+
+def systolic_bp_batch(bmi, age, gender_male, treatment):
+    """
+    The model over columns of patients. The plain function is mapped
+    directly; the curried wrapper would add dispatch to every row.
+
+    >>> systolic_bp_batch([25, 25], [50, 50], [1, 0], [0, 1])
+    [116.09, 121.59]
+    """
+    return list(map(systolic_bp_model, bmi, age, gender_male, treatment))
+
 tests_curry_1 = """
 >>> systolic_bp( 25, 50, 1, 0 )
 116.09
@@ -77,8 +88,12 @@ test_manual_curry = """
 """
 
 import operator
+from functools import reduce
 
-prod = myreduce(operator.mul)
+# prod = myreduce(operator.mul), with the loop done by the C reduce.
+@curry
+def prod(iterable):
+    return reduce(operator.mul, iterable)
 
 @curry
 def alt_range(n):
@@ -161,6 +176,19 @@ test_functor2 = """
 3.1415919276751456
 """
 
+from itertools import accumulate, chain
+def pi_series(terms: int = 20) -> float:
+    """
+    The sum from test_functor2 without the List functor: each
+    factorial and semifactorial is one multiplication by the last.
+
+    >>> pi_series()
+    3.1415919276751456
+    """
+    f1 = accumulate(chain((1,), range(1, terms)), operator.mul)
+    f2 = accumulate(range(1, 2*terms, 2), operator.mul)
+    return 2*sum(map(operator.truediv, f1, f2))
+
 test_bind = """
 >>> fact= prod * range1n
 >>> r= Just(3) >> Just * fact
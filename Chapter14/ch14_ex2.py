@@ -5,7 +5,8 @@ Chapter 14, Example Set 2
 """
 # pylint: disable=wrong-import-order
 
-from pymonad import curry, Just, List
+from pymonad import curry, Just
+from itertools import takewhile
 
 @curry
 def read_header(file):
@@ -16,12 +17,13 @@ def read_header(file):
 
 @curry
 def read_rest(file, data):
-    # file, data = file_data[0], file_data[1]
-    txt = file.readline().rstrip()
-    if txt:
-        row = float * List(*txt.split("\t"))
-        return Just(data + [list(row)]) >> read_rest(file)
-    return Just(data)
+    # One bind for the whole file: a recursive bind per line copied
+    # data each time and nested one call deeper.
+    rows = [
+        [float(v) for v in txt.split("\t")]
+        for txt in takewhile(bool, map(str.rstrip, file))
+    ]
+    return Just(data + rows)
 
 def anscombe():
     """
@@ -83,6 +85,35 @@ def craps(dice):
     )
     print(outcome.getValue())
 
+from collections import Counter
+def simulate(n_games, dice=rng):
+    """
+    Outcome counts for many games: the come_out_roll and point_roll
+    rules as a plain loop, with no Just wrapping or list of rolls.
+
+    >>> rolls = iter([(3, 4), (1, 1), (3, 3), (2, 2), (3, 3), (3, 3), (3, 4)])
+    >>> simulate(4, lambda: next(rolls))
+    Counter({'win': 2, 'lose': 1, 'craps': 1})
+    """
+    outcomes = Counter()
+    for _ in range(n_games):
+        point = sum(dice())
+        if point in (7, 11):
+            outcome = "win"
+        elif point in (2, 3, 12):
+            outcome = "lose"
+        else:
+            while True:
+                roll = sum(dice())
+                if roll == 7:
+                    outcome = "craps"
+                    break
+                if roll == point:
+                    outcome = "win"
+                    break
+        outcomes[outcome] += 1
+    return outcomes
+
 def test():
     import doctest
     doctest.testmod(verbose=1)
@@ -9,6 +9,7 @@ import wsgiref.util
 import urllib
 import urllib.parse
 from pathlib import Path
+import os
 import sys
 
 from typing import (
@@ -16,6 +17,13 @@ from typing import (
 )
 from mypy_extensions import DefaultArg
 
+# The suite runner lives at the top of the project; it's only
+# importable when the server is started from there.
+try:
+    import test_all
+except ImportError:
+    test_all = None
+
 # Requires mypy_extensions to properly declare the start_response callback.
 SR_Func = Callable[[str, List[Tuple[str, str]], DefaultArg(Tuple)], None]
 
@@ -57,18 +65,22 @@ def test_app(
         return [content]
     elif environ['REQUEST_METHOD'] == "POST":
         # Run tests, collect data in a cache file
-        import test_all
+        if test_all is None:
+            start_response("500 SERVER ERROR", [])
+            return []
+        chap_key = test_all.chap_key
+        master_test_suite = test_all.master_test_suite
+        package_module_iter = test_all.package_module_iter
         file_path = Path(environ['TMPDIR']) / "results"
         file_list = sorted(
             Path.cwd().glob("Chapter_*"),
-            key=lambda p: test_all.chap_key(p.name))
+            key=lambda p: chap_key(p.name))
         with file_path.open("w") as result_file:
             sys.stderr = result_file
             local_names = [
                 str(item.relative_to(Path.cwd())) for item in file_list
             ]
-            test_all.master_test_suite(
-                test_all.package_module_iter(*local_names))
+            master_test_suite(package_module_iter(*local_names))
             sys.stderr = sys.__stderr__
         # Might want to compute a distinct filename each time
         filename = {"filename": "results"}
@@ -97,12 +109,15 @@ def index_app(
     """Displays an index of available files."""
     log = environ['wsgi.errors']
     print("PATH_INFO '{0}'".format(environ['PATH_INFO']), file=log)
-    page = INDEX_TEMPLATE_HEAD.format(environ.get('PATH_INFO', '.'))
-    for entry in (Path.cwd()/environ['PATH_INFO'][1:]).glob('*'):
-        if entry.name.startswith('.'): continue
-        rel_path = entry.relative_to(Path.cwd())
-        page += '<p><a href="/static/{0}">{1}</a></p>'.format(rel_path, entry.name)
-    page += INDEX_TEMPLATE_FOOT
+    parts = [INDEX_TEMPLATE_HEAD.format(environ.get('PATH_INFO', '.'))]
+    parts.extend(
+        '<p><a href="/static/{0}">{1}</a></p>'.format(
+            entry.relative_to(Path.cwd()), entry.name)
+        for entry in (Path.cwd()/environ['PATH_INFO'][1:]).glob('*')
+        if not entry.name.startswith('.')
+    )
+    parts.append(INDEX_TEMPLATE_FOOT)
+    page = "".join(parts)
     content = page.encode("utf-8")
     headers = [
         ("Content-Type", 'text/html; charset="utf-8"'),
@@ -120,19 +135,21 @@ def static_app(
     try:
         print(f"CWD={Path.cwd()}", file=log)
         static_path = Path.cwd()/environ['PATH_INFO'][1:]
-        with static_path.open() as static_file:
-            content = static_file.read().encode("utf-8")
-            headers = [
-                ("Content-Type", 'text/plain; charset="utf-8"'),
-                ("Content-Length", str(len(content))),
-            ]
-            start_response('200 OK', headers)
-            return [content]
+        static_file = static_path.open('rb')
     except IsADirectoryError as e:
         return index_app(environ, start_response)
     except FileNotFoundError as e:
         start_response('404 NOT FOUND', [])
         return [f"Not Found {static_path}\n{e!r}".encode("utf-8")]
+    # The bytes go out as they are on disk, in blocks; the server's
+    # file_wrapper may use sendfile(), and closes the file when done.
+    headers = [
+        ("Content-Type", 'text/plain; charset="utf-8"'),
+        ("Content-Length", str(os.fstat(static_file.fileno()).st_size)),
+    ]
+    start_response('200 OK', headers)
+    file_wrapper = environ.get('wsgi.file_wrapper', wsgiref.util.FileWrapper)
+    return file_wrapper(static_file, 8192)
 
 WELCOME_TEMPLATE = """<html>
 <head>
@@ -155,18 +172,21 @@ WELCOME_TEMPLATE = """<html>
 </body>
 </html>"""
 
+# The page is static, so it's encoded once, at import.
+WELCOME_CONTENT = WELCOME_TEMPLATE.encode("utf-8")
+WELCOME_HEADERS = [
+    ("Content-Type", "text/html; charset=utf-8"),
+    ("Content-Length", str(len(WELCOME_CONTENT))),
+]
+
 def welcome_app(
         environ: Dict,
         start_response: SR_Func
     ) -> Union[Iterator[bytes], List[bytes]]:
     """Displays a page of greeting information."""
-    content = WELCOME_TEMPLATE.encode("utf-8")
-    headers = [
-        ("Content-Type", "text/html; charset=utf-8"),
-        ("Content-Length", str(len(content))),
-    ]
-    start_response('200 OK', headers)
-    return [content]
+    # A copy, since a server may add to the list it's given.
+    start_response('200 OK', list(WELCOME_HEADERS))
+    return [WELCOME_CONTENT]
 
 SCRIPT_MAP = {
     "demo": demo_app,
@@ -174,6 +194,7 @@ SCRIPT_MAP = {
     "test": test_app,
     "": welcome_app,
 }
+DEFAULT_APP = SCRIPT_MAP['']
 
 def routing(
         environ: Dict,
@@ -181,7 +202,7 @@ def routing(
     ) -> Union[Iterator[bytes], List[bytes]]:
     """Routing among the apps using the script information."""
     top_level = wsgiref.util.shift_path_info(environ)
-    app = SCRIPT_MAP.get(top_level, SCRIPT_MAP[''])
+    app = SCRIPT_MAP.get(top_level, DEFAULT_APP)
     content = app(environ, start_response)
     return content
 
@@ -17,7 +17,7 @@ from Chapter03.ch03_ex5 import (
     series, head_map_filter, row_iter)
 
 from typing import (
-    NamedTuple, Callable, List, Tuple, Iterable, Dict, Any)
+    NamedTuple, Callable, List, Tuple, Iterable, Iterator, Dict, Any)
 
 class Pair(NamedTuple):
     x: float
@@ -28,6 +28,19 @@ RawPairIter = Iterable[Tuple[float, float]]
 pairs: Callable[[RawPairIter], List[Pair]] \
      = lambda source: list(Pair(*row) for row in source)
 
+def _load(wrap: Callable[[RawPairIter], Any]) -> Dict[str, Any]:
+    """The four series from Anscombe.txt, each built by wrap()."""
+    with open("Anscombe.txt") as source:
+        data = tuple(head_map_filter(row_iter(source)))
+    return {
+        id_str: wrap(series(id_num, data))
+        for id_num, id_str in enumerate(['I', 'II', 'III', 'IV'])
+    }
+
+# The file doesn't change while the server runs, so it's parsed once.
+# Callers share the lists, and must not modify them.
+from functools import lru_cache
+@lru_cache(maxsize=1)
 def raw_data() -> Dict[str, List[Pair]]:
     """
     >>> with open("Anscombe.txt") as source:
@@ -37,21 +50,57 @@ def raw_data() -> Dict[str, List[Pair]]:
     ([10.0, 8.04, 10.0, 9.14, 10.0, 7.46, 8.0, 6.58], ...)
     >>> raw_data()['I']  # doctest: +ELLIPSIS
     [Pair(x=10.0, y=8.04), Pair(x=8.0, y=6.95), ...
+    >>> raw_data() is raw_data()
+    True
     """
-    with open("Anscombe.txt") as source:
-        data = tuple(head_map_filter(row_iter(source)))
-        mapping = {
-            id_str: pairs(series(id_num, data))
-            for id_num, id_str in enumerate(['I', 'II', 'III', 'IV'])
-        }
-    return mapping
+    return _load(pairs)
+
+from array import array
+class Series:
+    """
+    A series as two columns of C doubles, rather than a list of
+    Pair objects each holding two boxed floats. Iterating gives
+    Pairs, so the serializers accept either form.
+
+    >>> s = Series([Pair(2, 3), Pair(5, 7)])
+    >>> len(s), list(s)
+    (2, [Pair(x=2.0, y=3.0), Pair(x=5.0, y=7.0)])
+    >>> serialize_csv("test", s)
+    b'x,y\\r\\n2.0,3.0\\r\\n5.0,7.0\\r\\n'
+    """
+    __slots__ = ('x', 'y')
+    def __init__(self, pairs: Iterable[Tuple[float, float]]) -> None:
+        self.x = array('d')
+        self.y = array('d')
+        for x, y in pairs:
+            self.x.append(x)
+            self.y.append(y)
+    def __len__(self) -> int:
+        return len(self.x)
+    def __iter__(self) -> Iterator[Pair]:
+        return map(Pair, self.x, self.y)
+
+@lru_cache(maxsize=1)
+def raw_series() -> Dict[str, Series]:
+    """
+    The data the app serves: parsed straight into Series, without
+    going through the lists of Pairs from raw_data().
+
+    >>> list(raw_series()['I']) == raw_data()['I']
+    True
+    """
+    return _load(Series)
 
+from typing import Mapping, TypeVar
+Data = TypeVar('Data', List[Pair], Series)
 def anscombe_filter(
-        set_id: str, raw_data_map: Dict[str, List[Pair]]
-    ) -> List[Pair]:
+        set_id: str, raw_data_map: Mapping[str, Data]
+    ) -> Data:
     """
     >>> anscombe_filter( "II", raw_data() )  # doctest: +ELLIPSIS
     [Pair(x=10.0, y=9.14), Pair(x=8.0, y=8.14), Pair(x=13.0, y=8.74), ...
+    >>> list(anscombe_filter("II", raw_series())) == raw_data()["II"]
+    True
     """
     return raw_data_map[set_id]
 
@@ -65,21 +114,25 @@ def to_bytes(function: Callable[..., str]) -> Callable[..., bytes]:
         return text.encode("utf-8")
     return cast(Callable[..., bytes], decorated)
 
-import xml.etree.ElementTree as XML
-def serialize_xml(series: str, data: List[Pair]) -> bytes:
+# The document shape is fixed and the values are numbers, so it's
+# formatted directly, not built as an ElementTree; only the series
+# name needs escaping.
+from xml.sax.saxutils import escape
+xml_row = "<row><x>{0.x}</x><y>{0.y}</y></row>".format
+
+@to_bytes
+def serialize_xml(series: str, data: List[Pair]) -> str:
     """
     >>> data = [Pair(2,3), Pair(5,7)]
     >>> serialize_xml( "test", data )
     b'<series name="test"><row><x>2</x><y>3</y></row><row><x>5</x><y>7</y></row></series>'
+    >>> import xml.etree.ElementTree as XML
+    >>> XML.fromstring(serialize_xml('a "b" & c', data)).get("name")
+    'a "b" & c'
     """
-    doc = XML.Element("series", name=series)
-    for row in data:
-        row_xml = XML.SubElement(doc, "row")
-        x = XML.SubElement(row_xml, "x")
-        x.text = str(row.x)
-        y = XML.SubElement(row_xml, "y")
-        y.text = str(row.y)
-    return cast(bytes, XML.tostring(doc, encoding='utf-8'))
+    name = escape(series, {'"': "&quot;"})
+    return '<series name="{0}">{1}</series>'.format(
+        name, "".join(map(xml_row, data)))
 
 import string
 data_page = string.Template("""\
@@ -96,6 +149,8 @@ ${rows}
 </body>
 </html>
 """)
+html_row = "<tr><td>{0.x}</td><td>{0.y}</td></tr>".format
+
 @to_bytes
 def serialize_html(series: str, data: List[Pair]) -> str:
     """
@@ -105,23 +160,25 @@ def serialize_html(series: str, data: List[Pair]) -> str:
     """
     text = data_page.substitute(
         title=series,
-        rows="\n".join(
-            "<tr><td>{0.x}</td><td>{0.y}</td></tr>".format(row)
-            for row in data)
-        )
+        rows="\n".join(map(html_row, data))
+    )
     return text
 
-import json
-@to_bytes
-def serialize_json(series: str, data: List[Pair]) -> str:
+# orjson, when it's installed, encodes straight to compact UTF-8 bytes.
+try:
+    from orjson import dumps as json_bytes
+except ImportError:
+    import json
+    def json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode("utf-8")
+
+def serialize_json(series: str, data: List[Pair]) -> bytes:
     """
     >>> data = [Pair(2,3), Pair(5,7)]
     >>> serialize_json( "test", data )
-    b'[{"x": 2, "y": 3}, {"x": 5, "y": 7}]'
+    b'[{"x":2,"y":3},{"x":5,"y":7}]'
     """
-    obj = [dict(x=r.x, y=r.y) for r in data]
-    text = json.dumps(obj, sort_keys=True)
-    return text
+    return json_bytes([{"x": r.x, "y": r.y} for r in data])
 
 import csv
 import io
@@ -134,11 +191,33 @@ def serialize_csv(series: str, data: List[Pair]) -> str:
     b'x,y\\r\\n2,3\\r\\n5,7\\r\\n'
     """
     buffer = io.StringIO()
-    wtr = csv.DictWriter(buffer, Pair._fields)
-    wtr.writeheader()
-    wtr.writerows(r._asdict() for r in data)
+    wtr = csv.writer(buffer)
+    wtr.writerow(Pair._fields)
+    wtr.writerows(data)
     return buffer.getvalue()
 
+from itertools import islice
+csv_row = "{0.x},{0.y}\r\n".format
+
+def stream_csv(
+        series: str, data: Iterable[Pair], rows_per_chunk: int = 256
+    ) -> Iterator[bytes]:
+    """
+    The CSV body as a sequence of blocks, so a large series is never
+    held in memory as one string.
+
+    >>> data = [Pair(2,3), Pair(5,7)]
+    >>> b"".join(stream_csv("test", data, rows_per_chunk=1)) == serialize_csv("test", data)
+    True
+    """
+    yield b"x,y\r\n"
+    rows = iter(data)
+    while True:
+        block = list(islice(rows, rows_per_chunk))
+        if not block:
+            break
+        yield "".join(map(csv_row, block)).encode("utf-8")
+
 Serializer = Callable[[str, List[Pair]], bytes]
 serializers: Dict[str, Tuple[str, Serializer]]= {
     'xml': ('application/xml', serialize_xml),
@@ -147,12 +226,18 @@ serializers: Dict[str, Tuple[str, Serializer]]= {
     'csv': ('text/csv', serialize_csv),
 }
 
+# Formats sent as a stream of blocks, with no Content-Length.
+Streamer = Callable[[str, List[Pair]], Iterator[bytes]]
+streamers: Dict[str, Tuple[str, Streamer]] = {
+    'csv': ('text/csv', stream_csv),
+}
+
 def serialize(format: str, title: str, data: List[Pair]) -> Tuple[bytes, str]:
     """json/xml/csv/html serialization.
 
     >>> data = [Pair(2,3), Pair(5,7)]
     >>> serialize("json", "test", data)
-    (b'[{"x": 2, "y": 3}, {"x": 5, "y": 7}]', 'application/json')
+    (b'[{"x":2,"y":3},{"x":5,"y":7}]', 'application/json')
     """
     mime, function = serializers.get(
         format.lower(), ('text/html', serialize_html))
@@ -198,13 +283,19 @@ def anscombe_app(environ: Dict, start_response: SR_Func) -> Iterable[bytes]:
     try:
         match = path_pat.match(environ['PATH_INFO'])
         set_id = match.group('dataset').upper()
-        query = urllib.parse.parse_qs(environ['QUERY_STRING'])
-        print(environ['PATH_INFO'], environ['QUERY_STRING'],
+        query_string = environ['QUERY_STRING']
+        query = urllib.parse.parse_qs(query_string) if query_string else {}
+        print(environ['PATH_INFO'], query_string,
               match.groupdict(), file=log)
         log.flush()
 
-        dataset = anscombe_filter(set_id, raw_data())
-        content_bytes, mime = serialize(query['form'][0], set_id, dataset)
+        dataset = anscombe_filter(set_id, raw_series())
+        form = query['form'][0].lower()
+        if form in streamers:
+            mime, streamer = streamers[form]
+            start_response("200 OK", [('Content-Type', mime)])
+            return streamer(set_id, dataset)
+        content_bytes, mime = serialize(form, set_id, dataset)
 
         headers = [
             ('Content-Type', mime),
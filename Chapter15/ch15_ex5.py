@@ -16,22 +16,56 @@ class TestRandom:
     def randrange(self, low, high):
         self.calls += 1
         return (self.calls % (high-low)) + low
+    def randbytes(self, n):
+        return bytes(self.randrange(0, 256) for i in range(n))
+
+def random_bytes(rng, n):
+    """n random bytes, in one call if rng has randbytes() (Python 3.9+)."""
+    try:
+        randbytes = rng.randbytes
+    except AttributeError:
+        return bytes(rng.randrange(0, 256) for i in range(n))
+    return randbytes(n)
 
 import base64
-def make_key_1(rng=rng, size=1):
+import binascii
+URLSAFE_TABLE = bytes.maketrans(b'+/', b'-_')
+def urlsafe_text(key_bytes):
+    """base64.urlsafe_b64encode(key_bytes) as text, with one encoding
+    pass and one translate(), creating fewer intermediate objects.
+
+    >>> key_bytes = bytes(range(250, 256))
+    >>> urlsafe_text(key_bytes) == base64.urlsafe_b64encode(key_bytes).decode('us-ascii')
+    True
+    """
+    encoded = binascii.b2a_base64(key_bytes, newline=False)
+    return encoded.translate(URLSAFE_TABLE).decode('us-ascii')
+
+import secrets
+def make_key_1(rng=None, size=1):
     """Creates a 24*size character key of upper, lower, digits, - and _.
+    Without an rng, secrets.token_urlsafe() does all the work.
 
     >>> test_rng = TestRandom()
     >>> make_key_1(test_rng)
     'AQIDBAUGBwgJCgsMDQ4PEBES'
     >>> test_rng.calls
     18
+    >>> len(make_key_1())
+    24
     """
-    key_bytes = bytes(rng.randrange(0, 256) for i in range(18*size))
-    key_string = base64.urlsafe_b64encode(key_bytes).decode('us-ascii')
+    if rng is None:
+        return secrets.token_urlsafe(18*size)
+    return make_key_1_reproducible(rng, size)
+
+def make_key_1_reproducible(rng, size=1):
+    """make_key_1 from a given rng, so a TestRandom gives a known key."""
+    key_bytes = random_bytes(rng, 18*size)
+    key_string = urlsafe_text(key_bytes)
     return key_string
 
 import hashlib
+_sha384 = hashlib.sha384
 def make_key_2(rng=rng, size=2):
     """Creates a fixed-size key of upper, lower, digits, - and _.
     sha384 produces 48 bytes which are encoded as 64 characters.
@@ -43,11 +77,41 @@ def make_key_2(rng=rng, size=2):
     >>> test_rng.calls
     512
     """
-    raw_bytes = bytes(rng.randrange(0, 256) for i in range(256*size))
-    key_bytes = hashlib.sha384(raw_bytes).digest()
-    key_string = base64.urlsafe_b64encode(key_bytes).decode('us-ascii')
+    raw_bytes = random_bytes(rng, 256*size)
+    key_bytes = _sha384(raw_bytes).digest()
+    key_string = urlsafe_text(key_bytes)
     return key_string
 
+def make_keys_2(n, rng=rng, size=2):
+    """Yields n keys, each as make_key_2 would create it. The hash
+    constructor and encoder are looked up once for the whole batch.
+
+    >>> rng_1, rng_2 = TestRandom(), TestRandom()
+    >>> list(make_keys_2(3, rng_1)) == [make_key_2(rng_2) for _ in range(3)]
+    True
+    """
+    sha384, encode = _sha384, urlsafe_text
+    n_bytes = 256*size
+    for _ in range(n):
+        yield encode(sha384(random_bytes(rng, n_bytes)).digest())
+
+def make_key_2_stream(source):
+    """Like make_key_2, but the randomness is read from a binary file.
+    hashlib runs the read-and-update loop in C (file_digest, 3.11+).
+
+    >>> import io
+    >>> raw_bytes = TestRandom().randbytes(512)
+    >>> make_key_2_stream(io.BytesIO(raw_bytes)) == make_key_2(TestRandom())
+    True
+    """
+    if hasattr(hashlib, "file_digest"):
+        digest = hashlib.file_digest(source, "sha384")
+    else:
+        digest = hashlib.sha384()
+        for block in iter(lambda: source.read(64*1024), b""):
+            digest.update(block)
+    return urlsafe_text(digest.digest())
+
 def make_key_3(rng=rng, size=1):
     """Creates a 32*size character key of all upper case and digits.
 
@@ -57,14 +121,13 @@ def make_key_3(rng=rng, size=1):
     >>> test_rng.calls
     20
     """
-    key_bytes = bytes(rng.randrange(0, 256) for i in range(20*size))
+    key_bytes = random_bytes(rng, 20*size)
     key_string = base64.b32encode(key_bytes).decode('us-ascii')
     return key_string
 
 import uuid
 make_key_4 = lambda: uuid.uuid4()
 
-import secrets
 def make_key_5(size=1):
     """
     Creates a 24*size character key
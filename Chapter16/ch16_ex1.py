@@ -3,29 +3,33 @@
 
 Chapter 16, Example Set 1
 """
-from functools import reduce
-from operator import mul
-
-from typing import Callable, Iterable
-
-prod: Callable[[Iterable[int]], int] = lambda x: reduce(mul, x)
+from math import factorial
+try:
+    from math import comb, prod
+except ImportError:  # Before Python 3.8
+    from functools import reduce
+    from operator import mul
+    from typing import Callable, Iterable
+    def comb(n: int, k: int) -> int:
+        return factorial(n)//(factorial(k)*factorial(n-k))
+    prod: Callable[[Iterable[int]], int] = lambda x: reduce(mul, x, 1)
 
 class Binomial:
     """
     >>> binom= Binomial()
     >>> binom(52,5)
     2598960
+    >>> binom(5,0)
+    1
     """
     def __init__(self):
-        self.fact_cache = {}
         self.bin_cache = {}
     def fact(self, n: int) -> int:
-        if n not in self.fact_cache:
-            self.fact_cache[n] = prod(range(1, n+1))
-        return self.fact_cache[n]
+        # Was prod(range(1, n+1)), cached per instance.
+        return factorial(n)
     def __call__(self, n: int, m: int) -> int:
         if (n, m) not in self.bin_cache:
-            self.bin_cache[n, m] = self.fact(n)//(self.fact(m)*self.fact(n-m))
+            self.bin_cache[n, m] = comb(n, m)
         return self.bin_cache[n, m]
 
 test_example = """
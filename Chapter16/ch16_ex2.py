@@ -31,13 +31,15 @@ def defect_reduce(input_file: TextIO) -> Counter:
     >>> sum(defects.values())
     309
     """
-    rdr = csv.DictReader(input_file)
-    assert set(rdr.fieldnames) == set(["defect_type", "serial_number", "shift"])
-    rows_ns = (SimpleNamespace(**row) for row in rdr)
+    rdr = csv.reader(input_file)
+    header = next(rdr)
+    assert set(header) == set(["defect_type", "serial_number", "shift"])
+    i_shift = header.index("shift")
+    i_type = header.index("defect_type")
     defects = (
-        (row.shift, row.defect_type)
-        for row in rows_ns
-        if row.defect_type)
+        (row[i_shift], row[i_type])
+        for row in rdr
+        if row[i_type])
     tally = Counter(defects)
     return tally
 
@@ -101,20 +103,23 @@ def chi2_eval(defects: Counter) -> Fraction:
     total = sum(defects.values())
     print(f"Total {total}")
 
-    shift_totals = sum(
-        (Counter({s: defects[s, d]}) for s, d in defects),
-        Counter()  # start value is an empty Counter!
-    )
+    # Lay the cells out once as a shifts × types grid of counts. The
+    # margins are row and column sums of the grid, and chi2 walks it
+    # alongside them, so the dict is only read here.
+    shifts = sorted(set(s for s, _ in defects))
+    types = sorted(set(t for _, t in defects))
+    observed = [[defects[s, t] for t in types] for s in shifts]
+    row_totals = list(map(sum, observed))
+    col_totals = list(map(sum, zip(*observed)))
+    shift_totals = Counter(dict(zip(shifts, row_totals)))
+    type_totals = Counter(dict(zip(types, col_totals)))
+
     shift_detail = list(
         (s, shift_totals[s])
         for s in sorted(shift_totals)
     )
     print(f"Shift Total {shift_detail}")
 
-    type_totals = sum(
-        (Counter({d: defects[s, d]}) for s, d in defects),
-        Counter()  # start value = empty Counter
-    )
     type_detail = list(
         (t, type_totals[t])
         for t in sorted(type_totals))
@@ -138,8 +143,9 @@ def chi2_eval(defects: Counter) -> Fraction:
         (t, P_type[t]) for t in sorted(P_type))
     print(f"Prob(type) of defect {P_type_details}")
 
+    # P_shift[s]*P_type[t]*total, reduced to one Fraction per cell.
     expected = {
-        (s, t): P_shift[s]*P_type[t]*total
+        (s, t): Fraction(shift_totals[s]*type_totals[t], total)
         for t in P_type
         for s in P_shift
     }
@@ -159,24 +165,28 @@ def chi2_eval(defects: Counter) -> Fraction:
 
     # Difference
 
-    diff = lambda e, o: (e-o)**2/e
+    # (e-o)**2/e with e = n/total, n = shift total * type total,
+    # is (n - total*o)**2/(total*n): integer arithmetic, then one Fraction.
+    def diff(row_total: int, col_total: int, o: int) -> Fraction:
+        n = row_total*col_total
+        return Fraction((n - total*o)**2, total*n)
 
     chi2 = sum(
-        diff(expected[s, t], defects[s, t])
-        for s in shift_totals
-        for t in type_totals
+        diff(row_total, col_total, o)
+        for row_total, row in zip(row_totals, observed)
+        for col_total, o in zip(col_totals, row)
     )
     # Cast required to narrow sum from Union[Fraction, int] to Fraction
     return cast(Fraction, chi2)
 
-from Chapter16.ch16_ex3 import cdf
+from Chapter16.ch16_ex3 import cdf, cdf_float
 
 def demo():
     with open("qa_data.csv") as input_file:
         defects = defect_reduce(input_file)
     chi2 = chi2_eval(defects)
     print(f"χ² = {float(chi2):.2f}")
-    print(f"χ² = {chi2.limit_denominator(50)}, P = {float(cdf(chi2, 6)):0.3%}")
+    print(f"χ² = {chi2.limit_denominator(50)}, P = {cdf_float(float(chi2), 6):0.3%}")
     print(f"χ² = {chi2.limit_denominator(100)}, P = {cdf(chi2, 6).limit_denominator(1000)}")
 
 def test():
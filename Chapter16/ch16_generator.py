@@ -5,7 +5,7 @@ Chapter 16, Sample Data Generator
 """
 import csv
 import random
-from itertools import cycle, islice
+from itertools import chain, cycle, islice, repeat
 from typing import List, Tuple, Optional
 
 seed = [
@@ -23,41 +23,52 @@ seed = [
     ('3', 'D', 20),
 ]
 
-def create_data(seed: List[Tuple[str, str, int]]) -> None:
+def create_data(
+        seed: List[Tuple[str, str, int]],
+        size: int = 1000,
+        rng: Optional[random.Random] = None
+    ) -> None:
     Data = Tuple[str, Optional[str]]
+    # The random module's own functions by default, so random.seed() works.
+    shuffle = random.shuffle if rng is None else rng.shuffle
 
-    raw_defects: List[Data] = [
-        (shift, defect)
-        for shift, defect, count in seed for x in range(count)
-    ]
+    # Each (shift, defect) pair repeated count times; itertools does the
+    # expansion, not a Python-level loop per row.
+    raw_defects: List[Data] = list(chain.from_iterable(
+        repeat((shift, defect), count)
+        for shift, defect, count in seed
+    ))
+    if size < len(raw_defects):
+        raise ValueError(
+            f"size {size} is less than the {len(raw_defects)} defects in the seed")
 
-    # Should be `set(shift for shift, defect, count in seed)`
-    # Also 1000-309 is based on 1000-sum(count for shift, defect, count in seed)
-    shifts = ['1', '2', '3']
-    non_defects: List[Data] = [
-        (shift, None)
-        for shift in islice(cycle(shifts), 1000-309)
-    ]
+    shifts = sorted(set(shift for shift, defect, count in seed))
+    non_defects = islice(
+        zip(cycle(shifts), repeat(None)), size-len(raw_defects))
 
-    data = raw_defects + non_defects
+    data = raw_defects
+    data.extend(non_defects)
 
-    random.shuffle(data)
+    shuffle(data)
 
     with open("qa_data.csv", 'w', newline='') as output:
         wtr = csv.writer(output)
         wtr.writerow(["shift", "defect_type", "serial_number"])
         wtr.writerows(
-            (s_d[0], s_d[1], serial)
-            for serial, s_d in enumerate(data, start=12345)
+            (shift, defect, serial)
+            for serial, (shift, defect) in enumerate(data, start=12345)
         )
 
 def verify_data(seed: List[Tuple[str, str, int]]) -> None:
     from collections import Counter
     with open("qa_data.csv", newline="") as input_file:
-        rdr = csv.DictReader(input_file)
+        rdr = csv.reader(input_file)
+        header = next(rdr)
+        i_shift = header.index('shift')
+        i_type = header.index('defect_type')
         defects = (
-            (row['shift'], row['defect_type'])
-            for row in rdr if row['defect_type']
+            (row[i_shift], row[i_type])
+            for row in rdr if row[i_type]
         )
         tally = Counter(defects)
     print(tally)
@@ -22,24 +22,25 @@ def package_module_iter(*packages):
     """For a given list of packages, emit the package name and a generator
     for all modules in the package. Structured like ``itertools.groupby()``.
     """
-    def module_iter(package, module_iter):
+    def module_iter(package):
         if DEBUG:
             print("Package {0}".format(package))
-        for filename in module_iter:
-            basename = os.path.split(filename)[-1]
-            module, ext = os.path.splitext(basename)
-            if (
-                    module.startswith("__")
-                    and module.endswith("__")
-                    and ext == ".py"):
+        # scandir's entries carry their file type, so no extra stat() per file.
+        with os.scandir(package) as entries:
+            basenames = sorted(
+                entry.name for entry in entries
+                if entry.name.endswith(".py") and entry.is_file()
+            )
+        for basename in basenames:
+            module = basename[:-3]
+            if module.startswith("__") and module.endswith("__"):
                 continue
             if DEBUG:
                 print("  file {0} module {1}".format(basename, module))
             yield basename, module
 
     for package in packages:
-        yield (package,
-               module_iter(package, glob.glob(os.path.join(package,"*.py"))))
+        yield package, module_iter(package)
 
 def run(pkg_mod_iter):
     """Run each module."""
@@ -91,6 +92,37 @@ def master_test_suite(pkg_mod_iter):
     runner = unittest.TextTestRunner(verbosity=1)
     runner.run(master_suite)
 
+def _run_module_suite(name):
+    """Doctest one module in a worker process. Suites can't be pickled,
+    so the worker builds and runs it and sends back a summary."""
+    import io
+    stream = io.StringIO()
+    suite = doctest.DocTestSuite(name)
+    runner = unittest.TextTestRunner(stream=stream, verbosity=1)
+    result = runner.run(suite)
+    return (name, result.testsRun, len(result.failures),
+            len(result.errors), stream.getvalue())
+
+def parallel_test_suite(pkg_mod_iter, workers=None):
+    """Like ``master_test_suite()``, but with modules spread over a pool
+    of processes. Reports are printed in module order."""
+    import concurrent.futures
+    names = [
+        package+"."+module
+        for package, module_iter in pkg_mod_iter
+        for filename, module in module_iter
+    ]
+    totals = [0, 0, 0]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for name, run, failures, errors, report in pool.map(
+                _run_module_suite, names):
+            print(name, file=sys.stderr)
+            print(report, file=sys.stderr)
+            totals[0] += run
+            totals[1] += failures
+            totals[2] += errors
+    print("Ran {0} tests: {1} failures, {2} errors".format(*totals))
+
 def chap_key(name: str) -> int:
     _, _, n = name.partition("_")
     return int(n)
@@ -99,4 +131,4 @@ if __name__ == "__main__":
     content = sorted(glob.glob("Chapter_*"), key=chap_key)
     if DEBUG:
         print(content, file=sys.stderr)
-    master_test_suite(package_module_iter(*content))
+    parallel_test_suite(package_module_iter(*content))